@@ -9,6 +9,12 @@ class AppConstants {
   static const String obdInitCommand = 'ATZ';
   static const String obdEchoOffCommand = 'ATE0';
   static const String obdProtocolAutoCommand = 'ATSP0';
+  static const String obdIdentifyCommand = 'ATI';
+  
+  // Substrings of common ELM327 clone device names, upper-case
+  static const List<String> obdAdapterNameHints = [
+    'OBD', 'ELM', 'VLINK', 'V-LINK', 'VGATE', 'VEEPEAK', 'KONNWEI',
+  ];
   
   // Standard OBD-II PIDs with enhanced metadata
   static const Map<String, Map<String, dynamic>> standardPids = {
@@ -47,9 +53,11 @@ class AppConstants {
     '011F': {'name': 'Run time since engine start', 'unit': 's', 'category': 'Engine', 'displayOrder': 31, 'canDisplay': true, 'minValue': 0, 'maxValue': 65535},
   };
 
-  // Legacy support - simple map of PID to name
-  static Map<String, String> get pidNames => 
-      standardPids.map((key, value) => MapEntry(key, value['name'] as String));
+  // Legacy support - simple map of PID to name, built once on first access
+  // and shared read-only instead of rebuilt on every lookup
+  static final Map<String, String> pidNames = Map.unmodifiable(
+    standardPids.map((key, value) => MapEntry(key, value['name'] as String)),
+  );
   
   // Error codes
   static const Map<String, String> dtcCategories = {
@@ -1,4 +1,5 @@
 import 'dart:convert';
+import 'dart:typed_data';
 
 enum ResponseStatus { success, error, timeout, invalid }
 
@@ -40,17 +41,10 @@ class OBDResponse {
   /// Includes parsing logic for common PIDs and modes.
   factory OBDResponse.fromRaw(String raw, [String command = '']) {
     final timestamp = DateTime.now();
-    final cleanedData = raw
-        .trim()
-        .replaceAll('\r', '')
-        .replaceAll('\n', '')
-        .replaceAll('>', '')
-        .toUpperCase();
+    final cleanedData = _clean(raw);
 
     // Known error patterns
-    if (cleanedData.contains('ERROR') ||
-        cleanedData.contains('NO DATA') ||
-        cleanedData.contains('?')) {
+    if (_errorPattern.hasMatch(cleanedData)) {
       return OBDResponse(
         command: command,
         rawResponse: cleanedData,
@@ -140,6 +134,10 @@ class OBDResponse {
 
   // ===== Parsing =====
 
+  /// ELM327 error replies, matched in a single pass over the response
+  static final RegExp _errorPattern =
+      RegExp(r'ERROR|NO DATA|STOPPED|UNABLE TO CONNECT|\?');
+
   static Map<String, dynamic>? _parseResponse(String cleanData, String cmd) {
     final upperCmd = cmd.toUpperCase();
 
@@ -256,14 +254,73 @@ class OBDResponse {
     return {'raw_hex': cleanData};
   }
 
+  /// Drops line breaks and the ELM327 prompt, upper-cases ASCII letters and
+  /// trims surrounding blanks in a single pass over [raw]'s code units. The
+  /// adapter only speaks ASCII, so no Unicode case mapping is involved and
+  /// the result is built straight from one code unit buffer.
+  static String _clean(String raw) {
+    final out = Uint16List(raw.length);
+    var length = 0;
+    var end = 0; // one past the last non-blank code unit written
+    for (var i = 0; i < raw.length; i++) {
+      final c = raw.codeUnitAt(i);
+      if (c == 0x0D || c == 0x0A || c == 0x3E) continue; // \r \n >
+      if (c <= 0x20) {
+        if (length == 0) continue; // leading blank
+      } else {
+        end = length + 1;
+      }
+      // a-z -> A-Z
+      out[length++] = c >= 0x61 && c <= 0x7A ? c - 0x20 : c;
+    }
+    // Skip the protocol search progress line the adapter prints ahead of
+    // the first reply after ATSP0, so the data that follows still parses
+    var start = 0;
+    if (_hasPrefix(out, end, _searchingPrefix)) {
+      start = _searchingPrefix.length;
+      while (start < end && out[start] <= 0x20) {
+        start++;
+      }
+    }
+    return String.fromCharCodes(out, start, end);
+  }
+
+  static const String _searchingPrefix = 'SEARCHING...';
+
+  static bool _hasPrefix(Uint16List units, int length, String prefix) {
+    if (length < prefix.length) return false;
+    for (var i = 0; i < prefix.length; i++) {
+      if (units[i] != prefix.codeUnitAt(i)) return false;
+    }
+    return true;
+  }
+
+  /// Decodes space-separated hex pairs in one walk over [hex]'s code units,
+  /// without stripping spaces or slicing a substring per byte first. Odd
+  /// digit counts and non-hex replies (e.g. `OK`) yield an empty list.
   static List<int> _hexToBytes(String hex) {
-    final clean = hex.replaceAll(' ', '').toUpperCase();
-    if (clean.length % 2 != 0) return [];
     final out = <int>[];
-    for (var i = 0; i < clean.length; i += 2) {
-      out.add(int.parse(clean.substring(i, i + 2), radix: 16));
+    var high = -1;
+    for (var i = 0; i < hex.length; i++) {
+      final c = hex.codeUnitAt(i);
+      if (c == 0x20) continue;
+      final nibble = _hexNibble(c);
+      if (nibble < 0) return [];
+      if (high < 0) {
+        high = nibble;
+      } else {
+        out.add(high << 4 | nibble);
+        high = -1;
+      }
     }
-    return out;
+    return high < 0 ? out : [];
+  }
+
+  static int _hexNibble(int c) {
+    if (c >= 0x30 && c <= 0x39) return c - 0x30; // 0-9
+    if (c >= 0x41 && c <= 0x46) return c - 0x37; // A-F
+    if (c >= 0x61 && c <= 0x66) return c - 0x57; // a-f
+    return -1;
   }
 
   static List<String> _decodeDTCs(List<int> bytes) {
@@ -300,4 +357,45 @@ class OBDResponse {
 
     return dtcs;
   }
-}
\ No newline at end of file
+}
+/// Reads manufacturer PID payloads straight from a reply string, skipping
+/// spaces, instead of stripping them into a copy and re-parsing slices
+extension OBDHexPayload on String {
+  /// The whole payload as one integer; same result as
+  /// `int.parse(replaceAll(' ', ''), radix: 16)`.
+  int get hexValue {
+    var value = 0;
+    var digits = 0;
+    for (var i = 0; i < length; i++) {
+      final c = codeUnitAt(i);
+      if (c == 0x20) continue;
+      final nibble = OBDResponse._hexNibble(c);
+      if (nibble < 0) throw FormatException('Invalid hex payload', this, i);
+      value = value << 4 | nibble;
+      digits++;
+    }
+    if (digits == 0) throw FormatException('Empty hex payload', this);
+    return value;
+  }
+
+  /// Byte [index] of the payload, counting digit pairs with spaces skipped;
+  /// same result as parsing the two-digit slice of the stripped payload,
+  /// without making either copy.
+  int hexByteAt(int index) {
+    final first = index * 2;
+    var position = 0;
+    var high = -1;
+    for (var i = 0; i < length; i++) {
+      final c = codeUnitAt(i);
+      if (c == 0x20) continue;
+      if (position >= first) {
+        final nibble = OBDResponse._hexNibble(c);
+        if (nibble < 0) throw FormatException('Invalid hex payload', this, i);
+        if (high >= 0) return high << 4 | nibble;
+        high = nibble;
+      }
+      position++;
+    }
+    throw RangeError('Hex payload has no byte $index');
+  }
+}
@@ -16,6 +16,9 @@ class AIDiagnosticsService {
   static StreamController<AIDiagnosticResult>? _diagnosticStreamController;
   static StreamController<AnalysisProgress>? _progressStreamController;
   
+  // One generator shared by all mock generators instead of a new one per call
+  static final Random _random = Random();
+  
   // Mock ML model confidence scores
   static const double _baseModelConfidence = 0.85;
   static const List<String> _supportedSystems = [
@@ -243,27 +246,25 @@ class AIDiagnosticsService {
     Map<String, dynamic> data,
   ) async {
     final insights = <AIInsight>[];
-    final random = Random();
-    
     // Generate fuel efficiency insight
     insights.add(AIInsight(
       id: _generateId(),
       title: 'Fuel Efficiency',
-      description: 'Your driving patterns suggest a ${8 + random.nextInt(10)}% improvement in fuel efficiency over the past month.',
+      description: 'Your driving patterns suggest a ${8 + _random.nextInt(10)}% improvement in fuel efficiency over the past month.',
       type: InsightType.efficiency,
       severity: InsightSeverity.info,
-      data: {'improvement_percentage': 8 + random.nextInt(10)},
-      confidence: _baseModelConfidence + random.nextDouble() * 0.1,
+      data: {'improvement_percentage': 8 + _random.nextInt(10)},
+      confidence: _baseModelConfidence + _random.nextDouble() * 0.1,
     ));
 
     // Generate maintenance timing insight
     insights.add(AIInsight(
       id: _generateId(),
       title: 'Maintenance Timing',
-      description: 'Based on current usage patterns, your next oil change should be scheduled in ${2 + random.nextInt(3)} weeks.',
+      description: 'Based on current usage patterns, your next oil change should be scheduled in ${2 + _random.nextInt(3)} weeks.',
       type: InsightType.maintenance,
       severity: InsightSeverity.info,
-      data: {'weeks_until_service': 2 + random.nextInt(3)},
+      data: {'weeks_until_service': 2 + _random.nextInt(3)},
       confidence: _baseModelConfidence,
     ));
 
@@ -287,7 +288,6 @@ class AIDiagnosticsService {
     List<AIInsight> insights,
   ) async {
     final recommendations = <AIRecommendation>[];
-    final random = Random();
 
     // Check air filter recommendation
     recommendations.add(AIRecommendation(
@@ -297,15 +297,15 @@ class AIDiagnosticsService {
       type: RecommendationType.preventive,
       priority: Priority.medium,
       actions: ['Inspect air filter', 'Replace if dirty', 'Check housing for damage'],
-      estimatedCost: 25.0 + random.nextDouble() * 20,
-      estimatedTime: Duration(minutes: 15 + random.nextInt(15)),
+      estimatedCost: 25.0 + _random.nextDouble() * 20,
+      estimatedTime: Duration(minutes: 15 + _random.nextInt(15)),
     ));
 
     // Driving optimization recommendation
     recommendations.add(AIRecommendation(
       id: _generateId(),
       title: 'Optimize Driving Style',
-      description: 'Small adjustments to acceleration patterns could improve fuel economy by ${3 + random.nextInt(5)}%.',
+      description: 'Small adjustments to acceleration patterns could improve fuel economy by ${3 + _random.nextInt(5)}%.',
       type: RecommendationType.optimization,
       priority: Priority.low,
       actions: ['Gradual acceleration', 'Maintain steady speeds', 'Anticipate stops'],
@@ -322,8 +322,8 @@ class AIDiagnosticsService {
         type: RecommendationType.inspection,
         priority: Priority.high,
         actions: ['Schedule professional inspection', 'Monitor closely', 'Document symptoms'],
-        estimatedCost: 100.0 + random.nextDouble() * 50,
-        estimatedTime: Duration(minutes: 60 + random.nextInt(60)),
+        estimatedCost: 100.0 + _random.nextDouble() * 50,
+        estimatedTime: Duration(minutes: 60 + _random.nextInt(60)),
       ));
     }
 
@@ -332,8 +332,7 @@ class AIDiagnosticsService {
 
   /// Generate mock system analysis
   static SystemAnalysis _generateMockSystemAnalysis(String systemName) {
-    final random = Random();
-    final healthScore = 0.7 + random.nextDouble() * 0.3; // 70-100%
+    final healthScore = 0.7 + _random.nextDouble() * 0.3; // 70-100%
     
     SystemStatus status;
     if (healthScore >= 0.9) {
@@ -363,25 +362,22 @@ class AIDiagnosticsService {
 
   /// Generate mock vehicle data
   static Map<String, dynamic> _generateMockVehicleData() {
-    final random = Random();
     return {
-      'engine_rpm': 800 + random.nextInt(2000),
-      'vehicle_speed': random.nextInt(80),
-      'coolant_temp': 80 + random.nextInt(20),
-      'engine_load': random.nextDouble() * 100,
-      'fuel_pressure': 40 + random.nextDouble() * 20,
-      'intake_air_temp': 20 + random.nextInt(30),
-      'throttle_position': random.nextDouble() * 100,
+      'engine_rpm': 800 + _random.nextInt(2000),
+      'vehicle_speed': _random.nextInt(80),
+      'coolant_temp': 80 + _random.nextInt(20),
+      'engine_load': _random.nextDouble() * 100,
+      'fuel_pressure': 40 + _random.nextDouble() * 20,
+      'intake_air_temp': 20 + _random.nextInt(30),
+      'throttle_position': _random.nextDouble() * 100,
     };
   }
 
   /// Quick analysis for real-time data
   static Future<AIDiagnosticResult?> _runQuickAnalysis(String vehicleId, Map<String, dynamic> data) async {
     // Simplified analysis for real-time processing
-    final random = Random();
-    
     // Only generate result if significant change detected
-    if (random.nextBool()) {
+    if (_random.nextBool()) {
       return null; // No significant changes
     }
 
@@ -468,12 +464,11 @@ class AIDiagnosticsService {
 
   /// Generate mock parameters for a system
   static Map<String, double> _generateMockParameters(String systemName) {
-    final random = Random();
     return {
-      'efficiency': 0.7 + random.nextDouble() * 0.3,
-      'temperature': 20 + random.nextDouble() * 60,
-      'pressure': random.nextDouble() * 100,
-      'flow_rate': random.nextDouble() * 50,
+      'efficiency': 0.7 + _random.nextDouble() * 0.3,
+      'temperature': 20 + _random.nextDouble() * 60,
+      'pressure': _random.nextDouble() * 100,
+      'flow_rate': _random.nextDouble() * 50,
     };
   }
 
@@ -27,6 +27,13 @@ class DataLoggingService {
   Duration _loggingInterval = const Duration(seconds: 1);
   Set<String> _enabledPids = {};
   
+  // Statistics per session instance. Sessions are immutable and every change
+  // goes through copyWith, so an edited session never hits a stale entry.
+  final Expando<Map<String, dynamic>> _sessionStatistics = Expando('sessionStatistics');
+
+  // Stored JSON per session instance, so saving re-encodes only new sessions
+  final Expando<String> _encodedSessions = Expando('encodedSessions');
+  
   // Getters
   bool get isLogging => _isLogging;
   LoggingSession? get currentSession => _currentSession;
@@ -173,15 +180,19 @@ class DataLoggingService {
 
   /// Export session data to JSON format
   Future<String> exportToJson(LoggingSession session) async {
-    final sessionJson = {
-      'session': session.toJson(),
-      'exportTime': DateTime.now().toIso8601String(),
-      'exportVersion': '1.1.0',
-    };
-
-    return const JsonEncoder.withIndent('  ').convert(sessionJson);
+    return const JsonEncoder.withIndent('  ').convert(_jsonExport(session));
   }
 
+  Map<String, dynamic> _jsonExport(LoggingSession session) => {
+    'session': session.toJson(),
+    'exportTime': DateTime.now().toIso8601String(),
+    'exportVersion': '1.1.0',
+  };
+
+  // Archive entries are encoded straight to UTF-8 bytes instead of going
+  // through an intermediate String
+  static const JsonUtf8Encoder _jsonBytesEncoder = JsonUtf8Encoder('  ');
+
   /// Export session data to compressed archive
   Future<List<int>> exportToArchive(List<LoggingSession> sessions, {
     bool includeJson = true,
@@ -193,28 +204,28 @@ class DataLoggingService {
       final sessionFolder = 'session_${session.id}';
       
       // Add session metadata
-      final metadataJson = const JsonEncoder.withIndent('  ').convert(session.toJson());
+      final metadataJson = _jsonBytesEncoder.convert(session.toJson());
       archive.addFile(ArchiveFile(
         '$sessionFolder/metadata.json',
         metadataJson.length,
-        utf8.encode(metadataJson),
+        metadataJson,
       ));
 
       if (includeJson) {
-        final jsonData = await exportToJson(session);
+        final jsonData = _jsonBytesEncoder.convert(_jsonExport(session));
         archive.addFile(ArchiveFile(
           '$sessionFolder/data.json',
           jsonData.length,
-          utf8.encode(jsonData),
+          jsonData,
         ));
       }
 
       if (includeCsv) {
-        final csvData = await exportToCsv(session);
+        final csvData = utf8.encode(await exportToCsv(session));
         archive.addFile(ArchiveFile(
           '$sessionFolder/data.csv',
           csvData.length,
-          utf8.encode(csvData),
+          csvData,
         ));
       }
     }
@@ -226,11 +237,11 @@ class DataLoggingService {
       'totalDataPoints': sessions.fold<int>(0, (sum, session) => sum + session.dataPoints.length),
       'exportVersion': '1.1.0',
     };
-    final summaryJson = const JsonEncoder.withIndent('  ').convert(summary);
+    final summaryJson = _jsonBytesEncoder.convert(summary);
     archive.addFile(ArchiveFile(
       'export_summary.json',
       summaryJson.length,
-      utf8.encode(summaryJson),
+      summaryJson,
     ));
 
     return ZipEncoder().encode(archive)!;
@@ -246,9 +257,8 @@ class DataLoggingService {
 
     final directory = await getApplicationDocumentsDirectory();
     final exportsDir = Directory('${directory.path}/obd2_exports');
-    if (!await exportsDir.exists()) {
-      await exportsDir.create(recursive: true);
-    }
+    // create is a no-op when the directory already exists
+    await exportsDir.create(recursive: true);
 
     final file = File('${exportsDir.path}/$fileName');
     await file.writeAsBytes(data);
@@ -276,8 +286,13 @@ class DataLoggingService {
     }).toList();
   }
 
-  /// Get aggregated statistics for a session
+  /// Get aggregated statistics for a session. The result is cached per
+  /// session and shared between callers, so it is read-only.
   Map<String, dynamic> getSessionStatistics(LoggingSession session) {
+    return _sessionStatistics[session] ??= _computeSessionStatistics(session);
+  }
+
+  Map<String, dynamic> _computeSessionStatistics(LoggingSession session) {
     final stats = <String, dynamic>{};
     
     // Group data points by PID
@@ -300,24 +315,24 @@ class DataLoggingService {
           .toList();
 
       if (numericValues.isNotEmpty) {
-        pidStats[entry.key] = {
+        pidStats[entry.key] = Map.unmodifiable({
           'count': pidData.length,
           'errorCount': pidData.where((dp) => dp.isError).length,
           'min': numericValues.reduce((a, b) => a < b ? a : b),
           'max': numericValues.reduce((a, b) => a > b ? a : b),
           'average': numericValues.reduce((a, b) => a + b) / numericValues.length,
           'unit': pidData.first.unit,
-        };
+        });
       } else {
-        pidStats[entry.key] = {
+        pidStats[entry.key] = Map.unmodifiable({
           'count': pidData.length,
           'errorCount': pidData.where((dp) => dp.isError).length,
-        };
+        });
       }
     }
     
-    stats['pidStatistics'] = pidStats;
-    return stats;
+    stats['pidStatistics'] = Map<String, Map<String, dynamic>>.unmodifiable(pidStats);
+    return Map.unmodifiable(stats);
   }
 
   // Private methods
@@ -358,7 +373,9 @@ class DataLoggingService {
       for (final sessionJson in sessionsJson) {
         try {
           final sessionMap = jsonDecode(sessionJson);
-          _sessions.add(LoggingSession.fromJson(sessionMap));
+          final session = LoggingSession.fromJson(sessionMap);
+          _encodedSessions[session] = sessionJson;
+          _sessions.add(session);
         } catch (e) {
           debugPrint('Error parsing session data: $e');
         }
@@ -371,7 +388,9 @@ class DataLoggingService {
   Future<void> _saveSessions() async {
     try {
       final prefs = await SharedPreferences.getInstance();
-      final sessionsJson = _sessions.map((session) => jsonEncode(session.toJson())).toList();
+      final sessionsJson = _sessions
+          .map((session) => _encodedSessions[session] ??= jsonEncode(session.toJson()))
+          .toList();
       await prefs.setStringList('logging_sessions', sessionsJson);
     } catch (e) {
       debugPrint('Error saving sessions: $e');
@@ -16,12 +16,23 @@ class EcuProgrammingService {
   
   static final Map<String, ProgrammingSession> _activeSessions = {};
   static final List<EcuInfo> _discoveredEcus = [];
+  // Completed by cancelSession so a running session stops at its next wait
+  static final Map<String, Completer<void>> _cancellations = {};
 
   static Stream<ProgrammingSession> get sessionStream => _sessionController.stream;
   static List<EcuInfo> get discoveredEcus => List.unmodifiable(_discoveredEcus);
 
-  /// Initialize the ECU programming service
-  static Future<void> initialize() async {
+  static Future<void>? _initialization;
+
+  /// Initialize the ECU programming service.
+  ///
+  /// Runs at most once. The async entry points ([discoverEcus],
+  /// [startProgrammingSession], [cancelSession]) call it on first use so app
+  /// startup does not load programming state for users who never flash; the
+  /// synchronous session getters only see previous sessions after that.
+  static Future<void> initialize() => _initialization ??= _initialize();
+
+  static Future<void> _initialize() async {
     try {
       await _loadPreviousSessions();
       debugPrint('ECU Programming Service initialized');
@@ -32,6 +43,7 @@ class EcuProgrammingService {
 
   /// Discover available ECUs in the vehicle
   static Future<List<EcuInfo>> discoverEcus() async {
+    await initialize();
     _discoveredEcus.clear();
     
     final vehicle = VehicleService.selectedVehicle;
@@ -96,6 +108,7 @@ class EcuProgrammingService {
     required ProgrammingMode mode,
     required String filePath,
   }) async {
+    await initialize();
     final ecu = _discoveredEcus.firstWhere(
       (e) => e.id == ecuId,
       orElse: () => throw Exception('ECU not found: $ecuId'),
@@ -126,6 +139,7 @@ class EcuProgrammingService {
     );
 
     _activeSessions[sessionId] = session;
+    _cancellations[sessionId] = Completer<void>();
     _sessionController.add(session);
 
     // Start the programming process asynchronously
@@ -156,17 +170,16 @@ class EcuProgrammingService {
   /// Verify programming file integrity
   static Future<bool> verifyProgrammingFile(String filePath) async {
     try {
-      final file = File(filePath);
-      if (!await file.exists()) return false;
-
-      // Calculate checksum
-      final bytes = await file.readAsBytes();
+      // Calculate checksum; a missing file fails the read itself
+      final bytes = await File(filePath).readAsBytes();
       final digest = sha256.convert(bytes);
       
       // In a real implementation, you would verify against known checksums
       debugPrint('File checksum: ${digest.toString()}');
       
       return true;
+    } on PathNotFoundException {
+      return false;
     } catch (e) {
       debugPrint('Error verifying file: $e');
       return false;
@@ -175,6 +188,7 @@ class EcuProgrammingService {
 
   /// Cancel an active programming session
   static Future<void> cancelSession(String sessionId) async {
+    await initialize();
     final session = _activeSessions[sessionId];
     if (session == null) return;
 
@@ -186,6 +200,11 @@ class EcuProgrammingService {
 
     _activeSessions[sessionId] = updatedSession;
     _sessionController.add(updatedSession);
+
+    final cancellation = _cancellations[sessionId];
+    if (cancellation != null && !cancellation.isCompleted) {
+      cancellation.complete();
+    }
   }
 
   /// Get active programming sessions
@@ -213,10 +232,11 @@ class EcuProgrammingService {
       _activeSessions[sessionId] = session;
       _sessionController.add(session);
       
-      await Future.delayed(const Duration(seconds: 2));
+      if (!await _pause(sessionId, const Duration(seconds: 2))) return;
 
       // Create backup
       final backupPath = await createEcuBackup(session.ecuId);
+      if (_isCancelled(sessionId)) return;
       session = session.copyWith(
         status: ProgrammingStatus.reading,
         progress: 20.0,
@@ -226,7 +246,7 @@ class EcuProgrammingService {
       _activeSessions[sessionId] = session;
       _sessionController.add(session);
 
-      await Future.delayed(const Duration(seconds: 3));
+      if (!await _pause(sessionId, const Duration(seconds: 3))) return;
 
       // Erase
       session = session.copyWith(
@@ -237,7 +257,7 @@ class EcuProgrammingService {
       _activeSessions[sessionId] = session;
       _sessionController.add(session);
 
-      await Future.delayed(const Duration(seconds: 2));
+      if (!await _pause(sessionId, const Duration(seconds: 2))) return;
 
       // Program
       session = session.copyWith(
@@ -248,9 +268,9 @@ class EcuProgrammingService {
       _activeSessions[sessionId] = session;
       _sessionController.add(session);
 
-      // Simulate programming progress
-      for (int i = 40; i <= 80; i += 10) {
-        await Future.delayed(const Duration(milliseconds: 800));
+      // Simulate programming progress; 40% was published with the stage change
+      for (int i = 50; i <= 80; i += 10) {
+        if (!await _pause(sessionId, const Duration(milliseconds: 800))) return;
         session = session.copyWith(
           progress: i.toDouble(),
           log: [...session.log, 'Programming progress: $i%'],
@@ -268,7 +288,7 @@ class EcuProgrammingService {
       _activeSessions[sessionId] = session;
       _sessionController.add(session);
 
-      await Future.delayed(const Duration(seconds: 2));
+      if (!await _pause(sessionId, const Duration(seconds: 2))) return;
 
       // Complete
       session = session.copyWith(
@@ -281,6 +301,7 @@ class EcuProgrammingService {
       _sessionController.add(session);
 
     } catch (e) {
+      if (_isCancelled(sessionId)) return;
       session = session.copyWith(
         status: ProgrammingStatus.error,
         endTime: DateTime.now(),
@@ -289,9 +310,25 @@ class EcuProgrammingService {
       );
       _activeSessions[sessionId] = session;
       _sessionController.add(session);
+    } finally {
+      _cancellations.remove(sessionId);
     }
   }
 
+  static bool _isCancelled(String sessionId) =>
+      _cancellations[sessionId]?.isCompleted ?? false;
+
+  /// Waits for [duration] but returns early once [sessionId] is cancelled.
+  /// Returns false if the session was cancelled and should stop.
+  static Future<bool> _pause(String sessionId, Duration duration) async {
+    final cancellation = _cancellations[sessionId];
+    await Future.any([
+      Future<void>.delayed(duration),
+      if (cancellation != null) cancellation.future,
+    ]);
+    return !_isCancelled(sessionId);
+  }
+
   static Future<void> _loadPreviousSessions() async {
     // In a real implementation, load previous sessions from storage
   }
@@ -78,7 +78,9 @@ class FordService {
       // Add calculated Ford-specific values
       liveData.addAll(_calculateFordSpecificData(liveData));
 
-      debugPrint('$_logTag: Retrieved ${liveData.length} Ford live data points');
+      if (kDebugMode) {
+        debugPrint('$_logTag: Retrieved ${liveData.length} Ford live data points');
+      }
       return liveData;
     } catch (e) {
       debugPrint('$_logTag: Error getting Ford live data: $e');
@@ -196,35 +198,30 @@ class FordService {
   // Ford-specific parsing methods
   double _parseBoostPressure(String data) {
     // Convert hex data to boost pressure in PSI
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value * 0.145038).roundToDouble(); // Convert to PSI
   }
 
   double _parseEgrPosition(String data) {
     // Convert hex data to EGR position percentage
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value / 255.0 * 100).roundToDouble();
   }
 
   double _parseDefLevel(String data) {
     // Convert hex data to DEF level percentage
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value / 255.0 * 100).roundToDouble();
   }
 
   double _parseTransmissionTemp(String data) {
     // Convert hex data to transmission temperature in Fahrenheit
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value * 1.8 + 32).roundToDouble();
   }
 
   String _parseSyncStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     switch (value) {
       case 0: return 'Offline';
       case 1: return 'Connecting';
@@ -235,30 +232,26 @@ class FordService {
   }
 
   bool _parseAccStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   bool _parseLkaStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   Map<String, dynamic> _parseEcoBoostData(String data) {
     // Parse complex EcoBoost performance data
-    final hex = data.replaceAll(' ', '');
     return {
-      'boost_target': (int.parse(hex.substring(0, 2), radix: 16) * 0.1).roundToDouble(),
-      'boost_actual': (int.parse(hex.substring(2, 4), radix: 16) * 0.1).roundToDouble(),
-      'wastegate_position': (int.parse(hex.substring(4, 6), radix: 16) / 255.0 * 100).roundToDouble(),
+      'boost_target': (data.hexByteAt(0) * 0.1).roundToDouble(),
+      'boost_actual': (data.hexByteAt(1) * 0.1).roundToDouble(),
+      'wastegate_position': (data.hexByteAt(2) / 255.0 * 100).roundToDouble(),
     };
   }
 
   String _parse4WdStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     switch (value) {
       case 0: return '2WD';
       case 1: return 'AUTO';
@@ -269,11 +262,10 @@ class FordService {
   }
 
   Map<String, dynamic> _parseTrailerBrakeStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'connected': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'gain_setting': int.parse(hex.substring(2, 4), radix: 16),
-      'brake_applied': int.parse(hex.substring(4, 6), radix: 16) == 1,
+      'connected': data.hexByteAt(0) == 1,
+      'gain_setting': data.hexByteAt(1),
+      'brake_applied': data.hexByteAt(2) == 1,
     };
   }
 
@@ -48,12 +48,14 @@ class GMService {
     'ENABLE_PROGRAMMING': '10 02'
   };
 
+  // GM makes supported by this service
+  static const Set<String> _gmBrands = {'chevrolet', 'cadillac', 'gmc', 'buick'};
+
   GMService(this._obdService);
 
   /// Initialize GM service with vehicle information
   void initialize(VehicleInfo vehicle) {
-    final gmBrands = ['chevrolet', 'cadillac', 'gmc', 'buick'];
-    if (!gmBrands.contains(vehicle.make.toLowerCase())) {
+    if (!_gmBrands.contains(vehicle.make.toLowerCase())) {
       throw ArgumentError('Vehicle must be a GM brand (Chevrolet, Cadillac, GMC, Buick) for GM service');
     }
     _currentVehicle = vehicle;
@@ -90,7 +92,9 @@ class GMService {
       // Add calculated GM-specific values
       liveData.addAll(_calculateGMSpecificData(liveData));
 
-      debugPrint('$_logTag: Retrieved ${liveData.length} GM live data points');
+      if (kDebugMode) {
+        debugPrint('$_logTag: Retrieved ${liveData.length} GM live data points');
+      }
       return liveData;
     } catch (e) {
       debugPrint('$_logTag: Error getting GM live data: $e');
@@ -98,37 +102,22 @@ class GMService {
     }
   }
 
+  // Brand-specific PID subsets, keyed by lower-case make
+  static const Map<String, List<String>> _brandPidKeys = {
+    'chevrolet': ['GM01', 'GM02', 'GM03', 'GM06', 'GM07'],
+    'cadillac': ['GM08', 'GM09', 'GM10', 'GM11', 'GM12', 'GM13'],
+    'gmc': ['GM01', 'GM06', 'GM14', 'GM15', 'GM16'],
+  };
+
+  // Display names come from _gmPids so each name is defined once
+  static final Map<String, Map<String, String>> _brandPids = {
+    for (final MapEntry(key: brand, value: pids) in _brandPidKeys.entries)
+      brand: {for (final pid in pids) pid: _gmPids[pid]!},
+  };
+
   /// Get brand-specific PIDs for the current vehicle
   Map<String, String> _getBrandSpecificPids(String make) {
-    switch (make.toLowerCase()) {
-      case 'chevrolet':
-        return {
-          'GM01': _gmPids['GM01']!,
-          'GM02': _gmPids['GM02']!,
-          'GM03': _gmPids['GM03']!,
-          'GM06': _gmPids['GM06']!,
-          'GM07': _gmPids['GM07']!,
-        };
-      case 'cadillac':
-        return {
-          'GM08': _gmPids['GM08']!,
-          'GM09': _gmPids['GM09']!,
-          'GM10': _gmPids['GM10']!,
-          'GM11': _gmPids['GM11']!,
-          'GM12': _gmPids['GM12']!,
-          'GM13': _gmPids['GM13']!,
-        };
-      case 'gmc':
-        return {
-          'GM01': _gmPids['GM01']!,
-          'GM06': _gmPids['GM06']!,
-          'GM14': _gmPids['GM14']!,
-          'GM15': _gmPids['GM15']!,
-          'GM16': _gmPids['GM16']!,
-        };
-      default:
-        return _gmPids;
-    }
+    return _brandPids[make.toLowerCase()] ?? _gmPids;
   }
 
   /// Parse GM-specific PID responses
@@ -270,20 +259,17 @@ class GMService {
 
   // GM-specific parsing methods
   bool _parseAfmStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   double _parseTransmissionPressure(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value * 0.1).roundToDouble(); // Convert to PSI
   }
 
   Map<String, dynamic> _parseDfmStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return {
       'active': (value & 0x01) == 1,
       'mode': (value & 0x0E) >> 1, // Bits 1-3 for mode
@@ -292,26 +278,23 @@ class GMService {
   }
 
   Map<String, dynamic> _parseMagneticRideStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'mode': int.parse(hex.substring(0, 2), radix: 16),
-      'front_damping': int.parse(hex.substring(2, 4), radix: 16),
-      'rear_damping': int.parse(hex.substring(4, 6), radix: 16),
+      'mode': data.hexByteAt(0),
+      'front_damping': data.hexByteAt(1),
+      'rear_damping': data.hexByteAt(2),
     };
   }
 
   Map<String, dynamic> _parseZ51Data(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'track_mode_active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'performance_traction_mgmt': int.parse(hex.substring(2, 4), radix: 16),
-      'magnetic_ride_mode': int.parse(hex.substring(4, 6), radix: 16),
+      'track_mode_active': data.hexByteAt(0) == 1,
+      'performance_traction_mgmt': data.hexByteAt(1),
+      'magnetic_ride_mode': data.hexByteAt(2),
     };
   }
 
   String _parse4WdStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     switch (value) {
       case 0: return '2WD';
       case 1: return 'AUTO';
@@ -322,80 +305,70 @@ class GMService {
   }
 
   Map<String, dynamic> _parseTrailerBrakeController(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'trailer_connected': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'gain_setting': int.parse(hex.substring(2, 4), radix: 16),
-      'brake_output': int.parse(hex.substring(4, 6), radix: 16),
+      'trailer_connected': data.hexByteAt(0) == 1,
+      'gain_setting': data.hexByteAt(1),
+      'brake_output': data.hexByteAt(2),
     };
   }
 
   Map<String, dynamic> _parseSuperCruiseStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'available': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'active': int.parse(hex.substring(2, 4), radix: 16) == 1,
-      'hands_detected': int.parse(hex.substring(4, 6), radix: 16) == 1,
-      'map_data_current': int.parse(hex.substring(6, 8), radix: 16) == 1,
+      'available': data.hexByteAt(0) == 1,
+      'active': data.hexByteAt(1) == 1,
+      'hands_detected': data.hexByteAt(2) == 1,
+      'map_data_current': data.hexByteAt(3) == 1,
     };
   }
 
   Map<String, dynamic> _parseMagneticRideControl(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'mode': ['Comfort', 'Sport', 'Track'][int.parse(hex.substring(0, 2), radix: 16).clamp(0, 2)],
-      'damping_force': int.parse(hex.substring(2, 4), radix: 16),
+      'mode': ['Comfort', 'Sport', 'Track'][data.hexByteAt(0).clamp(0, 2)],
+      'damping_force': data.hexByteAt(1),
     };
   }
 
   double _parseAirSuspensionHeight(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value * 0.1).roundToDouble(); // Convert to inches
   }
 
   double _parseSuperchargerBoost(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value * 0.1).roundToDouble(); // Convert to PSI
   }
 
   bool _parseLaunchControlStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   Map<String, dynamic> _parseTrackModeData(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'preset': int.parse(hex.substring(2, 4), radix: 16),
-      'traction_control': int.parse(hex.substring(4, 6), radix: 16),
+      'active': data.hexByteAt(0) == 1,
+      'preset': data.hexByteAt(1),
+      'traction_control': data.hexByteAt(2),
     };
   }
 
   Map<String, dynamic> _parseCarbonFiberBedData(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'weight_detected': int.parse(hex.substring(0, 2), radix: 16),
-      'load_distribution': int.parse(hex.substring(2, 4), radix: 16),
+      'weight_detected': data.hexByteAt(0),
+      'load_distribution': data.hexByteAt(1),
     };
   }
 
   Map<String, dynamic> _parseMultiProTailgateStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'position': ['Closed', 'Half-Open', 'Fully Open'][int.parse(hex.substring(0, 2), radix: 16).clamp(0, 2)],
-      'inner_gate_open': int.parse(hex.substring(2, 4), radix: 16) == 1,
+      'position': ['Closed', 'Half-Open', 'Fully Open'][data.hexByteAt(0).clamp(0, 2)],
+      'inner_gate_open': data.hexByteAt(1) == 1,
     };
   }
 
   Map<String, dynamic> _parseAT4OffRoadData(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'mode': ['Normal', 'Terrain', 'Tow/Haul', 'Off-Road'][int.parse(hex.substring(0, 2), radix: 16).clamp(0, 3)],
-      'hill_descent_active': int.parse(hex.substring(2, 4), radix: 16) == 1,
+      'mode': ['Normal', 'Terrain', 'Tow/Haul', 'Off-Road'][data.hexByteAt(0).clamp(0, 3)],
+      'hill_descent_active': data.hexByteAt(1) == 1,
     };
   }
 
@@ -7,6 +7,9 @@ class LocalizationService {
   static const String _basePath = 'assets/data/strings';
   static Map<String, dynamic> _localizedStrings = {};
   static String _currentLanguage = 'en';
+  // Resolved strings by key path for the loaded language, so repeated
+  // lookups from build methods skip splitting and walking the path
+  static final Map<String, String> _resolvedStrings = {};
 
   static String get currentLanguage => _currentLanguage;
 
@@ -37,10 +40,24 @@ class LocalizationService {
       // If all else fails, use default empty map
       _localizedStrings = {};
     }
+    _resolvedStrings.clear();
   }
 
   /// Get localized string by key path (e.g., 'navigation.dashboard')
   static String getString(String keyPath, {Map<String, String>? params}) {
+    String result = _resolvedStrings[keyPath] ??= _resolve(keyPath);
+    
+    // Replace parameters if provided
+    if (params != null) {
+      params.forEach((key, value) {
+        result = result.replaceAll('{$key}', value);
+      });
+    }
+    
+    return result;
+  }
+
+  static String _resolve(String keyPath) {
     final keys = keyPath.split('.');
     dynamic current = _localizedStrings;
     
@@ -53,16 +70,7 @@ class LocalizationService {
       }
     }
     
-    String result = current?.toString() ?? keyPath;
-    
-    // Replace parameters if provided
-    if (params != null) {
-      params.forEach((key, value) {
-        result = result.replaceAll('{$key}', value);
-      });
-    }
-    
-    return result;
+    return current?.toString() ?? keyPath;
   }
 
   /// Switch to a different language
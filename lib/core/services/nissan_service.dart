@@ -48,12 +48,14 @@ class NissanService {
     'CONSULT_MODE': '10 81'
   };
 
+  // Nissan group makes supported by this service
+  static const Set<String> _nissanBrands = {'nissan', 'infiniti'};
+
   NissanService(this._obdService);
 
   /// Initialize Nissan service with vehicle information
   void initialize(VehicleInfo vehicle) {
-    final nissanBrands = ['nissan', 'infiniti'];
-    if (!nissanBrands.contains(vehicle.make.toLowerCase())) {
+    if (!_nissanBrands.contains(vehicle.make.toLowerCase())) {
       throw ArgumentError('Vehicle must be a Nissan or Infiniti for Nissan service');
     }
     _currentVehicle = vehicle;
@@ -90,7 +92,9 @@ class NissanService {
       // Add calculated Nissan-specific values
       liveData.addAll(_calculateNissanSpecificData(liveData));
 
-      debugPrint('$_logTag: Retrieved ${liveData.length} Nissan live data points');
+      if (kDebugMode) {
+        debugPrint('$_logTag: Retrieved ${liveData.length} Nissan live data points');
+      }
       return liveData;
     } catch (e) {
       debugPrint('$_logTag: Error getting Nissan live data: $e');
@@ -98,34 +102,21 @@ class NissanService {
     }
   }
 
+  // Brand-specific PID subsets, keyed by lower-case make
+  static const Map<String, List<String>> _brandPidKeys = {
+    'nissan': ['NS01', 'NS02', 'NS03', 'NS04', 'NS05', 'NS06', 'NS07', 'NS13'],
+    'infiniti': ['NS04', 'NS06', 'NS09', 'NS10', 'NS11', 'NS12', 'NS14', 'NS15'],
+  };
+
+  // Display names come from _nissanPids so each name is defined once
+  static final Map<String, Map<String, String>> _brandPids = {
+    for (final MapEntry(key: brand, value: pids) in _brandPidKeys.entries)
+      brand: {for (final pid in pids) pid: _nissanPids[pid]!},
+  };
+
   /// Get brand-specific PIDs for the current vehicle
   Map<String, String> _getBrandSpecificPids(String make) {
-    switch (make.toLowerCase()) {
-      case 'nissan':
-        return {
-          'NS01': _nissanPids['NS01']!,
-          'NS02': _nissanPids['NS02']!,
-          'NS03': _nissanPids['NS03']!,
-          'NS04': _nissanPids['NS04']!,
-          'NS05': _nissanPids['NS05']!,
-          'NS06': _nissanPids['NS06']!,
-          'NS07': _nissanPids['NS07']!,
-          'NS13': _nissanPids['NS13']!,
-        };
-      case 'infiniti':
-        return {
-          'NS04': _nissanPids['NS04']!,
-          'NS06': _nissanPids['NS06']!,
-          'NS09': _nissanPids['NS09']!,
-          'NS10': _nissanPids['NS10']!,
-          'NS11': _nissanPids['NS11']!,
-          'NS12': _nissanPids['NS12']!,
-          'NS14': _nissanPids['NS14']!,
-          'NS15': _nissanPids['NS15']!,
-        };
-      default:
-        return _nissanPids;
-    }
+    return _brandPids[make.toLowerCase()] ?? _nissanPids;
   }
 
   /// Parse Nissan-specific PID responses
@@ -265,118 +256,103 @@ class NissanService {
 
   // Nissan-specific parsing methods
   double _parseCvtTemperature(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value - 40).toDouble(); // Convert to Celsius
   }
 
   double _parseCvtPressure(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value * 0.1).roundToDouble(); // Convert to bar
   }
 
   double _parseCvtRatio(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value / 100.0).roundToDouble();
   }
 
   Map<String, dynamic> _parseProPilotStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'available': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'active': int.parse(hex.substring(2, 4), radix: 16) == 1,
-      'steering_assist': int.parse(hex.substring(4, 6), radix: 16) == 1,
-      'speed_control': int.parse(hex.substring(6, 8), radix: 16) == 1,
+      'available': data.hexByteAt(0) == 1,
+      'active': data.hexByteAt(1) == 1,
+      'steering_assist': data.hexByteAt(2) == 1,
+      'speed_control': data.hexByteAt(3) == 1,
     };
   }
 
   Map<String, dynamic> _parseEPowerStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'engine_running': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'motor_power_percent': int.parse(hex.substring(2, 4), radix: 16),
-      'battery_charge_percent': int.parse(hex.substring(4, 6), radix: 16),
-      'generator_active': int.parse(hex.substring(6, 8), radix: 16) == 1,
+      'engine_running': data.hexByteAt(0) == 1,
+      'motor_power_percent': data.hexByteAt(1),
+      'battery_charge_percent': data.hexByteAt(2),
+      'generator_active': data.hexByteAt(3) == 1,
     };
   }
 
   Map<String, dynamic> _parseIntelligentAwdStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'mode': ['2WD', 'AWD Auto', 'AWD Lock'][int.parse(hex.substring(0, 2), radix: 16).clamp(0, 2)],
-      'front_torque_percent': int.parse(hex.substring(2, 4), radix: 16),
-      'rear_torque_percent': int.parse(hex.substring(4, 6), radix: 16),
+      'mode': ['2WD', 'AWD Auto', 'AWD Lock'][data.hexByteAt(0).clamp(0, 2)],
+      'front_torque_percent': data.hexByteAt(1),
+      'rear_torque_percent': data.hexByteAt(2),
     };
   }
 
   Map<String, dynamic> _parseVcrStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'compression_ratio': (int.parse(hex.substring(0, 4), radix: 16) / 100.0).roundToDouble(),
-      'actuator_position': int.parse(hex.substring(4, 6), radix: 16),
+      'compression_ratio': ((data.hexByteAt(0) << 8 | data.hexByteAt(1)) / 100.0).roundToDouble(),
+      'actuator_position': data.hexByteAt(2),
     };
   }
 
   Map<String, dynamic> _parseZoneBodyData(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'front_crumple_zone': int.parse(hex.substring(0, 2), radix: 16),
-      'side_impact_protection': int.parse(hex.substring(2, 4), radix: 16),
-      'rear_crumple_zone': int.parse(hex.substring(4, 6), radix: 16),
+      'front_crumple_zone': data.hexByteAt(0),
+      'side_impact_protection': data.hexByteAt(1),
+      'rear_crumple_zone': data.hexByteAt(2),
     };
   }
 
   Map<String, dynamic> _parseIntelligentCruiseControl(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'set_speed': int.parse(hex.substring(2, 4), radix: 16),
-      'following_distance': int.parse(hex.substring(4, 6), radix: 16),
+      'active': data.hexByteAt(0) == 1,
+      'set_speed': data.hexByteAt(1),
+      'following_distance': data.hexByteAt(2),
     };
   }
 
   Map<String, dynamic> _parseAroundViewMonitor(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'front_camera_active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'rear_camera_active': int.parse(hex.substring(2, 4), radix: 16) == 1,
-      'left_camera_active': int.parse(hex.substring(4, 6), radix: 16) == 1,
-      'right_camera_active': int.parse(hex.substring(6, 8), radix: 16) == 1,
+      'front_camera_active': data.hexByteAt(0) == 1,
+      'rear_camera_active': data.hexByteAt(1) == 1,
+      'left_camera_active': data.hexByteAt(2) == 1,
+      'right_camera_active': data.hexByteAt(3) == 1,
     };
   }
 
   bool _parseIntelligentEmergencyBraking(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   bool _parseBlindSpotWarning(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   bool _parseLaneDepartureWarning(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   Map<String, dynamic> _parseIntelligentForwardCollision(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'warning_level': int.parse(hex.substring(2, 4), radix: 16),
-      'brake_assist_active': int.parse(hex.substring(4, 6), radix: 16) == 1,
+      'active': data.hexByteAt(0) == 1,
+      'warning_level': data.hexByteAt(1),
+      'brake_assist_active': data.hexByteAt(2) == 1,
     };
   }
 
   bool _parseRearCrossTrafficAlert(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
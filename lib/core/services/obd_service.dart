@@ -1,5 +1,6 @@
 import 'dart:async';
 import 'dart:io';
+import 'dart:math';
 import 'dart:typed_data';
 import 'package:flutter/foundation.dart';
 import 'package:flutter_bluetooth_serial/flutter_bluetooth_serial.dart';
@@ -31,27 +32,72 @@ abstract class OBDService {
   bool get isConnected;
 }
 
-class MobileOBDService implements OBDService {
+/// Status and data stream plumbing shared by the platform implementations
+mixin _OBDServiceState {
   final StreamController<ConnectionStatus> _statusController = 
       StreamController<ConnectionStatus>.broadcast();
   final StreamController<OBDResponse> _dataController = 
       StreamController<OBDResponse>.broadcast();
   
-  BluetoothConnection? _bluetoothConnection;
   ConnectionStatus _currentStatus = ConnectionStatus.disconnected;
-  bool _sending = false; // Serialization lock
   
-  @override
   Stream<ConnectionStatus> get connectionStatus => _statusController.stream;
   
-  @override
   Stream<OBDResponse> get dataStream => _dataController.stream;
   
-  @override
   bool get isConnected => _currentStatus == ConnectionStatus.connected;
   
+  Future<void> disconnect();
+  
+  void _updateStatus(ConnectionStatus status) {
+    _currentStatus = status;
+    _statusController.add(status);
+  }
+  
+  void dispose() {
+    _statusController.close();
+    _dataController.close();
+    disconnect();
+  }
+}
+
+class MobileOBDService with _OBDServiceState implements OBDService {
+  BluetoothConnection? _bluetoothConnection;
+  StreamSubscription<Uint8List>? _inputSubscription;
+  ConnectionConfig? _activeConfig;
+  // Tail of the command queue; each transaction chains onto the previous one
+  Future<void> _commandQueue = Future<void>.value();
+
+  // Receive buffer shared across commands; bytes after a '>' prompt are kept
+  // for the next response instead of being dropped. Preallocated and reused,
+  // only grown if a single response outsizes it.
+  Uint8List _rxBuffer = Uint8List(_rxBufferSize);
+  int _rxLength = 0;
+  static const int _rxBufferSize = 4096;
+  Completer<String>? _pendingResponse;
+  static const int _elmPrompt = 0x3E; // '>'
+  static const int _carriageReturn = 0x0D;
+  
+  // Encoded command cache, bounded and evicted oldest-first
+  static const int _maxEncodedCommands = 256;
+  static final Map<String, Uint8List> _encodedCommands = {};
+  
+  // Short-lived cache for bonded device enumeration
+  static const Duration _deviceScanCacheTtl = Duration(seconds: 2);
+  final Stopwatch _deviceScanAge = Stopwatch();
+  List<String>? _cachedDevices;
+  
   @override
   Future<bool> connect(ConnectionConfig config) async {
+    // Reuse the live link instead of repeating the RFCOMM connect and
+    // adapter handshake for the same device
+    if (isConnected && _activeConfig == config) {
+      return true;
+    }
+    if (_bluetoothConnection != null) {
+      await disconnect();
+    }
+    
     try {
       _updateStatus(ConnectionStatus.connecting);
       
@@ -76,15 +122,18 @@ class MobileOBDService implements OBDService {
       
       _bluetoothConnection = await BluetoothConnection.toAddress(config.address);
       
+      // Single long-lived listener; sendCommand waits on framed responses.
+      // A closed or failed stream drops the cached connected state.
+      _inputSubscription = _bluetoothConnection!.input!.listen(
+        _onDataReceived,
+        onError: (Object error) => _onLinkLost(ConnectionStatus.error),
+        onDone: () => _onLinkLost(ConnectionStatus.disconnected),
+      );
+      
       // Initialize OBD-II
       await _initializeOBD();
       
-      // Start listening for data
-      _bluetoothConnection!.input!.listen((data) {
-        final response = String.fromCharCodes(data);
-        _dataController.add(OBDResponse.fromRaw(response));
-      });
-      
+      _activeConfig = config;
       _updateStatus(ConnectionStatus.connected);
       return true;
     } catch (e) {
@@ -94,17 +143,35 @@ class MobileOBDService implements OBDService {
   }
   
   Future<void> _initializeOBD() async {
-    // Send initialization commands
-    await sendCommand(AppConstants.obdInitCommand);
-    await Future.delayed(const Duration(milliseconds: 1000));
-    await sendCommand(AppConstants.obdEchoOffCommand);
-    await Future.delayed(const Duration(milliseconds: 500));
-    await sendCommand(AppConstants.obdProtocolAutoCommand);
+    // Reset and settings run as one batch holding the command queue, so a
+    // poll issued during resetAdapterAndReinit cannot land between ATZ and
+    // ATE0. Each command still waits for its own prompt since the ELM327
+    // aborts on early input; the prompt after ATZ is only printed once the
+    // reset has finished, so no fixed settle delay is needed.
+    await _transactAll(const [
+      AppConstants.obdInitCommand,
+      AppConstants.obdEchoOffCommand,
+      AppConstants.obdProtocolAutoCommand,
+    ]);
   }
   
   @override
   Future<void> disconnect() async {
     try {
+      await _inputSubscription?.cancel();
+      _inputSubscription = null;
+      _rxLength = 0;
+      // Fail the in-flight command now rather than leaving it to time out
+      // while it holds the command queue
+      final pending = _pendingResponse;
+      if (pending != null && !pending.isCompleted) {
+        pending.completeError(StateError('Disconnected'));
+      }
+      _pendingResponse = null;
+      _activeConfig = null;
+      _slowLiveData.clear();
+      // Drain queued writes before closing the link
+      await _bluetoothConnection?.output.allSent;
       await _bluetoothConnection?.close();
       _bluetoothConnection = null;
       _updateStatus(ConnectionStatus.disconnected);
@@ -119,72 +186,243 @@ class MobileOBDService implements OBDService {
       throw Exception('Not connected to OBD device');
     }
     
-    // Serialize commands to avoid interleaved responses
-    while (_sending) {
-      await Future.delayed(const Duration(milliseconds: 50));
+    try {
+      return await _query(command);
+    } catch (e) {
+      throw Exception('Failed to send command: $e');
     }
-    _sending = true;
+  }
+  
+  /// Send [command], parse the reply and publish it on the data stream.
+  /// Callers are expected to have checked the connection already.
+  Future<OBDResponse> _query(String command) async {
+    final rawResponse = await _transact(command);
+    
+    // Create OBD response and add to data stream
+    final response = OBDResponse.fromRaw(rawResponse, command);
+    _dataController.add(response);
+    
+    return response;
+  }
+  
+  /// Write a command and wait for its prompt-terminated reply.
+  /// Does not check [isConnected] so it can be used during the handshake.
+  Future<String> _transact(String command) {
+    return _serialized(() => _exchange(command, AppConstants.obdTimeoutMs));
+  }
+  
+  /// Run several commands back-to-back while holding the command queue once,
+  /// so no other caller can interleave between them.
+  Future<List<String>> _transactAll(List<String> commands) {
+    return _serialized(() async {
+      final responses = <String>[];
+      for (final command in commands) {
+        responses.add(await _exchange(command, AppConstants.obdTimeoutMs));
+      }
+      return responses;
+    });
+  }
+  
+  /// Serialize commands to avoid interleaved responses. Waiters are resumed
+  /// as soon as the previous command settles instead of polling a flag.
+  Future<T> _serialized<T>(Future<T> Function() action) async {
+    final previous = _commandQueue;
+    final done = Completer<void>();
+    _commandQueue = done.future;
+    await previous;
     
     try {
-      // Send command with carriage return
-      _bluetoothConnection!.output.add(Uint8List.fromList(command.codeUnits));
-      _bluetoothConnection!.output.add(Uint8List.fromList('\r'.codeUnits));
-      await _bluetoothConnection!.output.allSent;
-      
-      // Buffer response until ELM327 prompt '>' appears
+      return await action();
+    } finally {
+      done.complete();
+    }
+  }
+  
+  Future<String> _exchange(String command, int timeoutMs) async {
+    try {
+      // Register the waiter before writing so a fast reply is not missed;
+      // the listener frames the response on the ELM327 prompt '>'
       final completer = Completer<String>();
-      final buffer = StringBuffer();
-      late StreamSubscription subscription;
+      _pendingResponse = completer;
       
-      subscription = _bluetoothConnection!.input!.listen((data) {
-        final chunk = String.fromCharCodes(data);
-        buffer.write(chunk);
-        
-        // Check if we received the ELM327 prompt
-        if (buffer.toString().contains('>')) {
-          if (!completer.isCompleted) {
-            completer.complete(buffer.toString());
-            subscription.cancel();
-          }
-        }
-      });
-      
-      // Timeout handling
-      Timer(const Duration(milliseconds: AppConstants.obdTimeoutMs), () {
-        if (!completer.isCompleted) {
-          subscription.cancel();
-          completer.completeError(TimeoutException(
-            'Command timeout', 
-            const Duration(milliseconds: AppConstants.obdTimeoutMs),
-          ));
-        }
-      });
-      
-      final rawResponse = await completer.future;
+      // Send command with carriage return. No need to wait for allSent:
+      // the '>' prompt cannot arrive before the command has gone out.
+      _bluetoothConnection!.output.add(_encodeCommand(command));
       
-      // Create OBD response and add to data stream
-      final response = OBDResponse.fromRaw(rawResponse, command);
-      _dataController.add(response);
-      
-      return response;
-    } catch (e) {
-      throw Exception('Failed to send command: $e');
+      // Timeout handling; the finally block clears the pending waiter
+      final limit = Duration(milliseconds: timeoutMs);
+      return await completer.future.timeout(
+        limit,
+        onTimeout: () => throw TimeoutException('Command timeout', limit),
+      );
+    } on TimeoutException {
+      // The late reply (or the STOPPED the adapter prints when the next
+      // byte aborts the command) would otherwise complete the next waiter
+      await _resync(timeoutMs);
+      rethrow;
     } finally {
-      _sending = false;
+      _pendingResponse = null;
+    }
+  }
+  
+  /// Bring the adapter back in step after a timed-out command while still
+  /// holding the command queue. ATI is sent and every frame up to its reply
+  /// is swallowed: a late reply to the timed-out command, or the STOPPED
+  /// printed when ATI aborts it, arrives ahead of the identification line.
+  Future<void> _resync(int timeoutMs) async {
+    final connection = _bluetoothConnection;
+    if (connection == null) return;
+    
+    _rxLength = 0;
+    connection.output.add(_encodeCommand(AppConstants.obdIdentifyCommand));
+    
+    final limit = Duration(milliseconds: timeoutMs);
+    final elapsed = Stopwatch()..start();
+    try {
+      while (identical(_bluetoothConnection, connection)) {
+        final completer = Completer<String>();
+        _pendingResponse = completer;
+        final frame = await completer.future.timeout(limit - elapsed.elapsed);
+        if (frame.toUpperCase().contains('ELM')) return;
+      }
+    } on TimeoutException {
+      debugPrint('Adapter did not answer resync');
+      _rxLength = 0;
+    }
+  }
+  
+  /// The remote end went away; fail any in-flight command and publish the
+  /// new state so [isConnected] stays accurate without probing the link
+  void _onLinkLost(ConnectionStatus status) {
+    final connection = _bluetoothConnection;
+    if (connection == null) return;
+    debugPrint('Bluetooth link lost');
+    
+    final pending = _pendingResponse;
+    if (pending != null && !pending.isCompleted) {
+      pending.completeError(StateError('Connection lost'));
+    }
+    unawaited(_inputSubscription?.cancel());
+    unawaited(connection.close());
+    _inputSubscription = null;
+    _bluetoothConnection = null;
+    _activeConfig = null;
+    _rxLength = 0;
+    _slowLiveData.clear();
+    _updateStatus(status);
+  }
+  
+  /// Encoded command bytes with trailing CR. The command set is small and
+  /// repetitive, so each command is encoded once and reused.
+  static Uint8List _encodeCommand(String command) {
+    final cached = _encodedCommands[command];
+    if (cached != null) return cached;
+    
+    if (_encodedCommands.length >= _maxEncodedCommands) {
+      _encodedCommands.remove(_encodedCommands.keys.first);
+    }
+    return _encodedCommands[command] =
+        Uint8List.fromList([...command.codeUnits, _carriageReturn]);
+  }
+  
+  /// Accumulate raw input bytes and hand complete responses to the waiter
+  void _onDataReceived(Uint8List data) {
+    final newLength = _rxLength + data.length;
+    if (newLength > _rxBuffer.length) {
+      final grown = Uint8List(max(newLength, _rxBuffer.length * 2));
+      grown.setRange(0, _rxLength, _rxBuffer);
+      _rxBuffer = grown;
+    }
+    _rxBuffer.setRange(_rxLength, newLength, data);
+    _rxLength = newLength;
+    
+    // Only the new chunk can contain a fresh prompt
+    if (data.contains(_elmPrompt)) _drainPromptFrames();
+  }
+  
+  /// Hand every complete '>'-terminated frame to the pending command.
+  /// Bytes after the last prompt are moved to the front of the buffer.
+  void _drainPromptFrames() {
+    var promptIndex = _indexOfPrompt();
+    while (promptIndex >= 0) {
+      final frame = String.fromCharCodes(_rxBuffer, 0, promptIndex);
+      final remaining = _rxLength - promptIndex - 1;
+      _rxBuffer.setRange(0, remaining, _rxBuffer, promptIndex + 1);
+      _rxLength = remaining;
+      
+      final pending = _pendingResponse;
+      if (pending != null && !pending.isCompleted) {
+        _pendingResponse = null;
+        pending.complete(frame);
+      } else if (frame.trim().isNotEmpty) {
+        // Unsolicited output (e.g. adapter banner after a reset)
+        _dataController.add(OBDResponse.fromRaw(frame));
+      }
+      promptIndex = _indexOfPrompt();
+    }
+  }
+  
+  int _indexOfPrompt() {
+    for (var i = 0; i < _rxLength; i++) {
+      if (_rxBuffer[i] == _elmPrompt) return i;
     }
+    return -1;
   }
   
+  /// Lists bonded devices. Results are reused for [_deviceScanCacheTtl]
+  /// because the platform-channel query is slow.
   @override
   Future<List<String>> scanForDevices() async {
+    final cached = _cachedDevices;
+    if (cached != null && _deviceScanAge.elapsed < _deviceScanCacheTtl) {
+      return List.of(cached);
+    }
+    
     try {
       final devices = await FlutterBluetoothSerial.instance.getBondedDevices();
-      return devices.map((device) => '${device.name} (${device.address})').toList();
+      
+      // List devices that look like OBD adapters first so the usual
+      // candidate is at the top instead of headsets, watches, etc.
+      final likely = <String>[];
+      final others = <String>[];
+      for (final device in devices) {
+        final label = '${device.name} (${device.address})';
+        (_isLikelyAdapter(device.name) ? likely : others).add(label);
+      }
+      final names = [...likely, ...others];
+      _cachedDevices = names;
+      _deviceScanAge
+        ..reset()
+        ..start();
+      return List.of(names);
     } catch (e) {
       debugPrint('Device scan error: $e');
       return [];
     }
   }
 
+  // Common OBD-II parameters polled by getLiveData. Fast-moving values are
+  // read on every call; slow ones only once their interval has elapsed, so
+  // the adapter's bandwidth goes to the PIDs that actually change.
+  static const List<({String pid, String key, int intervalMs})> _liveDataPids = [
+    (pid: '010C', key: 'engineRpm', intervalMs: 0),
+    (pid: '010D', key: 'vehicleSpeed', intervalMs: 0),
+    (pid: '0105', key: 'coolantTemp', intervalMs: 2000),
+    (pid: '010F', key: 'intakeTemp', intervalMs: 2000),
+    (pid: '0104', key: 'engineLoad', intervalMs: 0),
+    (pid: '0111', key: 'throttlePosition', intervalMs: 0),
+  ];
+  
+  // Last reading of each slow live data PID and when it is next due
+  final Stopwatch _liveDataClock = Stopwatch()..start();
+  final Map<String, ({int dueMs, Object? value})> _slowLiveData = {};
+
+  static bool _isLikelyAdapter(String? name) {
+    if (name == null) return false;
+    final upper = name.toUpperCase();
+    return AppConstants.obdAdapterNameHints.any(upper.contains);
+  }
+
   @override
   Future<Map<String, dynamic>> getLiveData() async {
     if (!isConnected) {
@@ -193,25 +431,27 @@ class MobileOBDService implements OBDService {
 
     try {
       final Map<String, dynamic> liveData = {};
+      final now = _liveDataClock.elapsedMilliseconds;
       
-      // Get common OBD-II parameters
-      final commands = [
-        {'cmd': '010C', 'key': 'engineRpm'},
-        {'cmd': '010D', 'key': 'vehicleSpeed'},
-        {'cmd': '0105', 'key': 'coolantTemp'},
-        {'cmd': '010F', 'key': 'intakeTemp'},
-        {'cmd': '0104', 'key': 'engineLoad'},
-        {'cmd': '0111', 'key': 'throttlePosition'},
-      ];
-      
-      for (final cmdData in commands) {
+      for (final entry in _liveDataPids) {
+        final cached = _slowLiveData[entry.key];
+        if (cached != null && now < cached.dueMs) {
+          liveData[entry.key] = cached.value;
+          continue;
+        }
+        // The connection was checked once above; a PID that does not answer
+        // is skipped, but a lost link ends the whole poll
         try {
-          final response = await sendCommand(cmdData['cmd']!);
-          if (!response.isError && response.parsedData != null && response.parsedData!.isNotEmpty) {
-            liveData[cmdData['key']!] = response.parsedData!['value'];
+          final response = await _query(entry.pid);
+          if (!response.isError && response.parsedData.isNotEmpty) {
+            final value = response.parsedData['value'];
+            liveData[entry.key] = value;
+            if (entry.intervalMs > 0) {
+              _slowLiveData[entry.key] = (dueMs: now + entry.intervalMs, value: value);
+            }
           }
-        } catch (e) {
-          debugPrint('Error getting ${cmdData['key']}: $e');
+        } on TimeoutException catch (e) {
+          debugPrint('Error getting ${entry.key}: $e');
         }
       }
       
@@ -228,52 +468,15 @@ class MobileOBDService implements OBDService {
     }
 
     try {
-      // Reset the adapter
-      await sendCommand('ATZ');
-      await Future.delayed(const Duration(milliseconds: 1500));
-      
-      // Turn off echo
-      await sendCommand('ATE0');
-      await Future.delayed(const Duration(milliseconds: 500));
-      
-      // Set protocol to auto
-      await sendCommand('ATSP0');
-      await Future.delayed(const Duration(milliseconds: 500));
-      
+      // Same reset/echo-off/auto-protocol sequence used when connecting
+      await _initializeOBD();
     } catch (e) {
       throw Exception('Failed to reset adapter: $e');
     }
   }
-  
-  void _updateStatus(ConnectionStatus status) {
-    _currentStatus = status;
-    _statusController.add(status);
-  }
-  
-  void dispose() {
-    _statusController.close();
-    _dataController.close();
-    disconnect();
-  }
 }
 
-class DesktopOBDService implements OBDService {
-  final StreamController<ConnectionStatus> _statusController = 
-      StreamController<ConnectionStatus>.broadcast();
-  final StreamController<OBDResponse> _dataController = 
-      StreamController<OBDResponse>.broadcast();
-  
-  ConnectionStatus _currentStatus = ConnectionStatus.disconnected;
-  
-  @override
-  Stream<ConnectionStatus> get connectionStatus => _statusController.stream;
-  
-  @override
-  Stream<OBDResponse> get dataStream => _dataController.stream;
-  
-  @override
-  bool get isConnected => _currentStatus == ConnectionStatus.connected;
-  
+class DesktopOBDService with _OBDServiceState implements OBDService {
   @override
   Future<bool> connect(ConnectionConfig config) async {
     // Desktop implementation would use serial/USB connections
@@ -343,15 +546,4 @@ class DesktopOBDService implements OBDService {
       throw Exception('Failed to reset adapter: $e');
     }
   }
-  
-  void _updateStatus(ConnectionStatus status) {
-    _currentStatus = status;
-    _statusController.add(status);
-  }
-  
-  void dispose() {
-    _statusController.close();
-    _dataController.close();
-    disconnect();
-  }
 }
\ No newline at end of file
@@ -26,6 +26,11 @@ class SecureStorageService {
   static const String _pidConfigKey = 'pid_display_configuration';
   static const String _userPreferencesKey = 'user_preferences';
   
+  // JSON of the last preferences read or written; every write goes through
+  // saveUserPreferences, so this stays in step with secure storage. Loads
+  // decode it afresh so callers never share nested maps with the cache.
+  static String? _userPreferencesJson;
+  
   /// Initialize secure storage - generate encryption key if needed
   static Future<void> initialize() async {
     try {
@@ -105,7 +110,10 @@ class SecureStorageService {
   static Future<void> saveUserPreferences(Map<String, dynamic> preferences) async {
     try {
       final jsonString = jsonEncode(preferences);
+      // Unchanged preferences are not written back to secure storage
+      if (jsonString == _userPreferencesJson) return;
       await _secureStorage.write(key: _userPreferencesKey, value: jsonString);
+      _userPreferencesJson = jsonString;
     } catch (e) {
       throw SecureStorageException('Failed to save user preferences: $e');
     }
@@ -114,7 +122,8 @@ class SecureStorageService {
   /// Load user preferences
   static Future<Map<String, dynamic>> loadUserPreferences() async {
     try {
-      final jsonString = await _secureStorage.read(key: _userPreferencesKey);
+      final jsonString = _userPreferencesJson ??=
+          await _secureStorage.read(key: _userPreferencesKey);
       if (jsonString == null) return {};
       
       return Map<String, dynamic>.from(jsonDecode(jsonString));
@@ -127,6 +136,7 @@ class SecureStorageService {
   static Future<void> clearAll() async {
     try {
       await _secureStorage.deleteAll();
+      _userPreferencesJson = null;
       final prefs = await SharedPreferences.getInstance();
       await prefs.remove(_pidConfigKey);
     } catch (e) {
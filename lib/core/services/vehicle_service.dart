@@ -7,12 +7,18 @@ import '../../shared/models/vehicle_info.dart';
 class VehicleService {
   static VehicleDatabase? _database;
   static VehicleInfo? _selectedVehicle;
+  static Future<void>? _loading;
 
   static VehicleDatabase? get database => _database;
   static VehicleInfo? get selectedVehicle => _selectedVehicle;
 
-  /// Initialize the vehicle database from JSON
-  static Future<void> initialize() async {
+  /// Initialize the vehicle database from JSON.
+  ///
+  /// The bundled asset is loaded and parsed once; startup and the providers
+  /// that call this again share the same load.
+  static Future<void> initialize() => _loading ??= _loadDatabase();
+
+  static Future<void> _loadDatabase() async {
     try {
       final jsonString = await rootBundle.loadString('assets/data/vehicle_database.json');
       final json = jsonDecode(jsonString) as Map<String, dynamic>;
@@ -48,12 +48,14 @@ class VWService {
     'VAG_LOGIN': '27 17'
   };
 
+  // VW Group makes supported by this service
+  static const Set<String> _vwBrands = {'volkswagen', 'audi', 'bentley', 'porsche', 'skoda', 'seat'};
+
   VWService(this._obdService);
 
   /// Initialize VW service with vehicle information
   void initialize(VehicleInfo vehicle) {
-    final vwBrands = ['volkswagen', 'audi', 'bentley', 'porsche', 'skoda', 'seat'];
-    if (!vwBrands.contains(vehicle.make.toLowerCase())) {
+    if (!_vwBrands.contains(vehicle.make.toLowerCase())) {
       throw ArgumentError('Vehicle must be a VW Group brand (Volkswagen, Audi, Bentley, Porsche, Skoda, SEAT) for VW service');
     }
     _currentVehicle = vehicle;
@@ -90,7 +92,9 @@ class VWService {
       // Add calculated VW-specific values
       liveData.addAll(_calculateVWSpecificData(liveData));
 
-      debugPrint('$_logTag: Retrieved ${liveData.length} VW live data points');
+      if (kDebugMode) {
+        debugPrint('$_logTag: Retrieved ${liveData.length} VW live data points');
+      }
       return liveData;
     } catch (e) {
       debugPrint('$_logTag: Error getting VW live data: $e');
@@ -98,37 +102,22 @@ class VWService {
     }
   }
 
+  // Brand-specific PID subsets, keyed by lower-case make
+  static const Map<String, List<String>> _brandPidKeys = {
+    'volkswagen': ['VW01', 'VW02', 'VW04', 'VW05', 'VW13', 'VW15'],
+    'audi': ['VW03', 'VW08', 'VW09', 'VW10', 'VW11', 'VW12'],
+    'porsche': ['VW03', 'VW06', 'VW09', 'VW14'],
+  };
+
+  // Display names come from _vwPids so each name is defined once
+  static final Map<String, Map<String, String>> _brandPids = {
+    for (final MapEntry(key: brand, value: pids) in _brandPidKeys.entries)
+      brand: {for (final pid in pids) pid: _vwPids[pid]!},
+  };
+
   /// Get brand-specific PIDs for the current vehicle
   Map<String, String> _getBrandSpecificPids(String make) {
-    switch (make.toLowerCase()) {
-      case 'volkswagen':
-        return {
-          'VW01': _vwPids['VW01']!,
-          'VW02': _vwPids['VW02']!,
-          'VW04': _vwPids['VW04']!,
-          'VW05': _vwPids['VW05']!,
-          'VW13': _vwPids['VW13']!,
-          'VW15': _vwPids['VW15']!,
-        };
-      case 'audi':
-        return {
-          'VW03': _vwPids['VW03']!,
-          'VW08': _vwPids['VW08']!,
-          'VW09': _vwPids['VW09']!,
-          'VW10': _vwPids['VW10']!,
-          'VW11': _vwPids['VW11']!,
-          'VW12': _vwPids['VW12']!,
-        };
-      case 'porsche':
-        return {
-          'VW03': _vwPids['VW03']!,
-          'VW06': _vwPids['VW06']!,
-          'VW09': _vwPids['VW09']!,
-          'VW14': _vwPids['VW14']!,
-        };
-      default:
-        return _vwPids;
-    }
+    return _brandPids[make.toLowerCase()] ?? _vwPids;
   }
 
   /// Parse VW-specific PID responses
@@ -265,120 +254,105 @@ class VWService {
 
   // VW-specific parsing methods
   double _parseDsgTemperature(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value - 40).toDouble(); // Convert to Celsius
   }
 
   Map<String, dynamic> _parseDsgClutchStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'clutch_1_engaged': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'clutch_2_engaged': int.parse(hex.substring(2, 4), radix: 16) == 1,
-      'clutch_1_wear': int.parse(hex.substring(4, 6), radix: 16),
-      'clutch_2_wear': int.parse(hex.substring(6, 8), radix: 16),
+      'clutch_1_engaged': data.hexByteAt(0) == 1,
+      'clutch_2_engaged': data.hexByteAt(1) == 1,
+      'clutch_1_wear': data.hexByteAt(2),
+      'clutch_2_wear': data.hexByteAt(3),
     };
   }
 
   Map<String, dynamic> _parseQuattroStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'mode': ['Front', 'Rear', 'AWD', 'Lock'][int.parse(hex.substring(0, 2), radix: 16).clamp(0, 3)],
-      'front_torque_percent': int.parse(hex.substring(2, 4), radix: 16),
-      'rear_torque_percent': int.parse(hex.substring(4, 6), radix: 16),
+      'mode': ['Front', 'Rear', 'AWD', 'Lock'][data.hexByteAt(0).clamp(0, 3)],
+      'front_torque_percent': data.hexByteAt(1),
+      'rear_torque_percent': data.hexByteAt(2),
     };
   }
 
   double _parseAdBlueLevel(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value / 255.0 * 100).roundToDouble();
   }
 
   Map<String, dynamic> _parseDpfStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'regeneration_active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'soot_load_percent': int.parse(hex.substring(2, 4), radix: 16),
-      'regeneration_required': int.parse(hex.substring(4, 6), radix: 16) == 1,
+      'regeneration_active': data.hexByteAt(0) == 1,
+      'soot_load_percent': data.hexByteAt(1),
+      'regeneration_required': data.hexByteAt(2) == 1,
     };
   }
 
   double _parseWastegatePosition(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value / 255.0 * 100).roundToDouble();
   }
 
   double _parseEgrPosition(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return (value / 255.0 * 100).roundToDouble();
   }
 
   Map<String, dynamic> _parseAirSuspensionHeight(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'front_left': int.parse(hex.substring(0, 2), radix: 16),
-      'front_right': int.parse(hex.substring(2, 4), radix: 16),
-      'rear_left': int.parse(hex.substring(4, 6), radix: 16),
-      'rear_right': int.parse(hex.substring(6, 8), radix: 16),
+      'front_left': data.hexByteAt(0),
+      'front_right': data.hexByteAt(1),
+      'rear_left': data.hexByteAt(2),
+      'rear_right': data.hexByteAt(3),
     };
   }
 
   Map<String, dynamic> _parseAdaptiveDamping(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'mode': ['Comfort', 'Normal', 'Sport', 'Individual'][int.parse(hex.substring(0, 2), radix: 16).clamp(0, 3)],
-      'damping_force': int.parse(hex.substring(2, 4), radix: 16),
+      'mode': ['Comfort', 'Normal', 'Sport', 'Individual'][data.hexByteAt(0).clamp(0, 3)],
+      'damping_force': data.hexByteAt(1),
     };
   }
 
   Map<String, dynamic> _parseTrafficSignRecognition(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'speed_limit_detected': int.parse(hex.substring(2, 4), radix: 16),
-      'signs_detected': int.parse(hex.substring(4, 6), radix: 16),
+      'active': data.hexByteAt(0) == 1,
+      'speed_limit_detected': data.hexByteAt(1),
+      'signs_detected': data.hexByteAt(2),
     };
   }
 
   bool _parseLaneAssistStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   Map<String, dynamic> _parseParkingAssistStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'front_sensors_active': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'rear_sensors_active': int.parse(hex.substring(2, 4), radix: 16) == 1,
-      'auto_park_available': int.parse(hex.substring(4, 6), radix: 16) == 1,
+      'front_sensors_active': data.hexByteAt(0) == 1,
+      'rear_sensors_active': data.hexByteAt(1) == 1,
+      'auto_park_available': data.hexByteAt(2) == 1,
     };
   }
 
   bool _parseStartStopStatus(String data) {
-    final hex = data.replaceAll(' ', '');
-    final value = int.parse(hex, radix: 16);
+    final value = data.hexValue;
     return value == 1;
   }
 
   Map<String, dynamic> _parseBatteryManagement(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'voltage': (int.parse(hex.substring(0, 4), radix: 16) / 100.0).roundToDouble(),
-      'current': (int.parse(hex.substring(4, 8), radix: 16) / 10.0).roundToDouble(),
-      'temperature': int.parse(hex.substring(8, 10), radix: 16) - 40,
+      'voltage': ((data.hexByteAt(0) << 8 | data.hexByteAt(1)) / 100.0).roundToDouble(),
+      'current': ((data.hexByteAt(2) << 8 | data.hexByteAt(3)) / 10.0).roundToDouble(),
+      'temperature': data.hexByteAt(4) - 40,
     };
   }
 
   Map<String, dynamic> _parseInfotainmentStatus(String data) {
-    final hex = data.replaceAll(' ', '');
     return {
-      'system_online': int.parse(hex.substring(0, 2), radix: 16) == 1,
-      'software_version': '${int.parse(hex.substring(2, 4), radix: 16)}.${int.parse(hex.substring(4, 6), radix: 16)}',
-      'navigation_active': int.parse(hex.substring(6, 8), radix: 16) == 1,
+      'system_online': data.hexByteAt(0) == 1,
+      'software_version': '${data.hexByteAt(1)}.${data.hexByteAt(2)}',
+      'navigation_active': data.hexByteAt(3) == 1,
     };
   }
 
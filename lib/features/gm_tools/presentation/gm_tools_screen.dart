@@ -2,6 +2,7 @@ import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../../../core/services/gm_service.dart';
 import '../../../core/services/obd_service.dart';
+import '../../../shared/models/live_data_row.dart';
 import '../../../shared/models/vehicle_info.dart';
 import '../../../shared/widgets/data_card.dart';
 import '../../../shared/widgets/action_button.dart';
@@ -17,7 +18,7 @@ class GMToolsScreen extends ConsumerStatefulWidget {
 
 class _GMToolsScreenState extends ConsumerState<GMToolsScreen> {
   late GMService _gmService;
-  Map<String, dynamic> _liveData = {};
+  List<LiveDataRow> _liveDataRows = const [];
   bool _isConnected = false;
   bool _isLoading = false;
   String? _statusMessage;
@@ -92,7 +93,7 @@ class _GMToolsScreenState extends ConsumerState<GMToolsScreen> {
       final liveData = await _gmService.getGMLiveData();
       
       setState(() {
-        _liveData = liveData;
+        _liveDataRows = buildLiveDataRows(liveData, _getUnitForDataType);
         _statusMessage = 'Live data updated successfully';
       });
     } catch (e) {
@@ -311,7 +312,7 @@ class _GMToolsScreenState extends ConsumerState<GMToolsScreen> {
               const SizedBox(height: 12),
               
               // Live Data Grid
-              if (_liveData.isNotEmpty)
+              if (_liveDataRows.isNotEmpty)
                 Expanded(
                   flex: 2,
                   child: GridView.builder(
@@ -321,13 +322,13 @@ class _GMToolsScreenState extends ConsumerState<GMToolsScreen> {
                       crossAxisSpacing: 8,
                       mainAxisSpacing: 8,
                     ),
-                    itemCount: _liveData.length.clamp(0, 8), // Show max 8 items
+                    itemCount: _liveDataRows.length,
                     itemBuilder: (context, index) {
-                      final entry = _liveData.entries.elementAt(index);
+                      final row = _liveDataRows[index];
                       return DataCard(
-                        title: entry.key,
-                        value: entry.value.toString(),
-                        unit: _getUnitForDataType(entry.key),
+                        title: row.title,
+                        value: row.value,
+                        unit: row.unit,
                       );
                     },
                   ),
@@ -2,6 +2,7 @@ import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../../../core/services/nissan_service.dart';
 import '../../../core/services/obd_service.dart';
+import '../../../shared/models/live_data_row.dart';
 import '../../../shared/models/vehicle_info.dart';
 import '../../../shared/widgets/data_card.dart';
 import '../../../shared/widgets/action_button.dart';
@@ -16,7 +17,7 @@ class NissanToolsScreen extends ConsumerStatefulWidget {
 
 class _NissanToolsScreenState extends ConsumerState<NissanToolsScreen> {
   late NissanService _nissanService;
-  Map<String, dynamic> _liveData = {};
+  List<LiveDataRow> _liveDataRows = const [];
   bool _isConnected = false;
   bool _isLoading = false;
   String? _statusMessage;
@@ -77,7 +78,7 @@ class _NissanToolsScreenState extends ConsumerState<NissanToolsScreen> {
       final liveData = await _nissanService.getNissanLiveData();
       
       setState(() {
-        _liveData = liveData;
+        _liveDataRows = buildLiveDataRows(liveData, _getUnitForDataType);
         _statusMessage = 'Live data updated successfully';
       });
     } catch (e) {
@@ -224,7 +225,7 @@ class _NissanToolsScreenState extends ConsumerState<NissanToolsScreen> {
               const SizedBox(height: 12),
               
               // Live Data Grid
-              if (_liveData.isNotEmpty)
+              if (_liveDataRows.isNotEmpty)
                 Expanded(
                   flex: 2,
                   child: GridView.builder(
@@ -234,13 +235,13 @@ class _NissanToolsScreenState extends ConsumerState<NissanToolsScreen> {
                       crossAxisSpacing: 8,
                       mainAxisSpacing: 8,
                     ),
-                    itemCount: _liveData.length.clamp(0, 8), // Show max 8 items
+                    itemCount: _liveDataRows.length,
                     itemBuilder: (context, index) {
-                      final entry = _liveData.entries.elementAt(index);
+                      final row = _liveDataRows[index];
                       return DataCard(
-                        title: entry.key,
-                        value: entry.value.toString(),
-                        unit: _getUnitForDataType(entry.key),
+                        title: row.title,
+                        value: row.value,
+                        unit: row.unit,
                       );
                     },
                   ),
@@ -247,28 +247,32 @@ class _VehicleSettingsTabState extends ConsumerState<_VehicleSettingsTab> {
     );
   }
 
+  // In a real implementation, this would use the vehicle service
+  static const Map<String, List<String>> _modelsByMake = {
+    'Toyota': ['Camry', 'Prius', 'Corolla', 'RAV4'],
+    'Ford': ['F-150', 'Mustang', 'Explorer', 'Focus'],
+    'Honda': ['Civic', 'Accord', 'CR-V', 'Pilot'],
+    'BMW': ['3 Series', '5 Series', 'X3', 'X5'],
+    'Mercedes-Benz': ['C-Class', 'E-Class', 'GLC', 'GLE'],
+  };
+
   List<String> _getModelsForMake(String make) {
-    // In a real implementation, this would use the vehicle service
-    switch (make) {
-      case 'Toyota':
-        return ['Camry', 'Prius', 'Corolla', 'RAV4'];
-      case 'Ford':
-        return ['F-150', 'Mustang', 'Explorer', 'Focus'];
-      case 'Honda':
-        return ['Civic', 'Accord', 'CR-V', 'Pilot'];
-      case 'BMW':
-        return ['3 Series', '5 Series', 'X3', 'X5'];
-      case 'Mercedes-Benz':
-        return ['C-Class', 'E-Class', 'GLC', 'GLE'];
-      default:
-        return ['OBD-II Vehicle'];
-    }
+    return _modelsByMake[make] ?? const ['OBD-II Vehicle'];
   }
 
-  List<int> _getYearsForMakeModel(String make, String model) {
+  // Built once rather than on every build of the year dropdown
+  static final List<int> _modelYears = _generateModelYears();
+
+  static List<int> _generateModelYears() {
     // Generate years from 2000 to current year + 1
     final currentYear = DateTime.now().year;
-    return List.generate(currentYear - 1999, (index) => currentYear + 1 - index);
+    return List.unmodifiable(
+      List.generate(currentYear - 1999, (index) => currentYear + 1 - index),
+    );
+  }
+
+  List<int> _getYearsForMakeModel(String make, String model) {
+    return _modelYears;
   }
 }
 
@@ -7,7 +7,6 @@ import 'core/constants/app_constants.dart';
 import 'core/services/secure_storage_service.dart';
 import 'core/services/localization_service.dart';
 import 'core/services/vehicle_service.dart';
-import 'core/services/ecu_programming_service.dart';
 import 'core/services/cloud_sync_service.dart';
 import 'features/dashboard/presentation/dashboard_screen.dart';
 import 'features/settings/presentation/advanced_settings_screen.dart';
@@ -41,10 +40,10 @@ Future<void> _initializeServices() async {
     // Initialize localization with default language
     await LocalizationService.initialize('en');
     
-    // Initialize other services
+    // Initialize other services; ECU programming initializes itself on
+    // first use since most sessions never open it
     await Future.wait([
       VehicleService.initialize(),
-      EcuProgrammingService.initialize(),
       CloudSyncService.initialize(),
     ]);
     
@@ -0,0 +1,20 @@
+/// One cell of a manufacturer tools live data grid
+typedef LiveDataRow = ({String title, String value, String unit});
+
+/// Converts a live data map into grid rows when a refresh completes, so the
+/// grid indexes a list instead of walking the map and formatting every cell
+/// on each build. At most [maxRows] entries are kept.
+List<LiveDataRow> buildLiveDataRows(
+  Map<String, dynamic> liveData,
+  String Function(String dataType) unitFor, {
+  int maxRows = 8,
+}) {
+  return [
+    for (final entry in liveData.entries.take(maxRows))
+      (
+        title: entry.key,
+        value: entry.value.toString(),
+        unit: unitFor(entry.key),
+      ),
+  ];
+}
@@ -192,6 +192,19 @@ class PidDisplayProfile {
     );
   }
   
+  /// Commonly used PIDs, built from the PID metadata once and shared by
+  /// every default profile; edits go through copyWith with a new list
+  static final List<PidDisplayConfig> _defaultPidConfigs = List.unmodifiable([
+    PidDisplayConfig.fromPid('010C'), // Engine RPM
+    PidDisplayConfig.fromPid('010D'), // Vehicle Speed
+    PidDisplayConfig.fromPid('0105'), // Coolant Temperature
+    PidDisplayConfig.fromPid('0104'), // Engine Load
+    PidDisplayConfig.fromPid('010F'), // Intake Air Temperature
+    PidDisplayConfig.fromPid('0111'), // Throttle Position
+    PidDisplayConfig.fromPid('010A'), // Fuel Pressure
+    PidDisplayConfig.fromPid('010B'), // Manifold Pressure
+  ]);
+  
   /// Create default profile with commonly used PIDs
   factory PidDisplayProfile.createDefault() {
     return PidDisplayProfile(
@@ -199,16 +212,7 @@ class PidDisplayProfile {
       description: 'Standard engine and vehicle parameters',
       isDefault: true,
       lastModified: DateTime.now(),
-      pidConfigs: [
-        PidDisplayConfig.fromPid('010C'), // Engine RPM
-        PidDisplayConfig.fromPid('010D'), // Vehicle Speed
-        PidDisplayConfig.fromPid('0105'), // Coolant Temperature
-        PidDisplayConfig.fromPid('0104'), // Engine Load
-        PidDisplayConfig.fromPid('010F'), // Intake Air Temperature
-        PidDisplayConfig.fromPid('0111'), // Throttle Position
-        PidDisplayConfig.fromPid('010A'), // Fuel Pressure
-        PidDisplayConfig.fromPid('010B'), // Manifold Pressure
-      ],
+      pidConfigs: _defaultPidConfigs,
     );
   }
   
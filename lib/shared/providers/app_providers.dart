@@ -399,7 +399,6 @@ final servicesInitializedProvider = FutureProvider<bool>((ref) async {
   try {
     await Future.wait([
       VehicleService.initialize(),
-      EcuProgrammingService.initialize(),
       CloudSyncService.initialize(),
     ]);
     return true;
@@ -13,7 +13,7 @@ class DiagnosticWidget extends ConsumerStatefulWidget {
 
 class _DiagnosticWidgetState extends ConsumerState<DiagnosticWidget> {
   final _commandController = TextEditingController();
-  final List<String> _quickCommands = [
+  static const List<String> _quickCommands = [
     '0100', // PIDs supported
     '0101', // Monitor status
     '0103', // Fuel system status
@@ -24,6 +24,24 @@ class _DiagnosticWidgetState extends ConsumerState<DiagnosticWidget> {
     '0111', // Throttle position
   ];
 
+  // Quick command chip text, derived from the PID names once rather than on
+  // every build
+  static final List<({String command, String label, String tooltip})> _quickCommandChips =
+      _quickCommands.map((command) {
+        final description = AppConstants.pidNames[command] ?? 'Unknown';
+        return (
+          command: command,
+          label: '$command\n${description.split(' ').take(3).join(' ')}',
+          tooltip: description,
+        );
+      }).toList(growable: false);
+
+  // Placeholder DTC data
+  static const List<Map<String, String>> _placeholderDtcs = [
+    {'code': 'P0171', 'description': 'System Too Lean (Bank 1)'},
+    {'code': 'P0300', 'description': 'Random/Multiple Cylinder Misfire'},
+  ];
+
   @override
   void dispose() {
     _commandController.dispose();
@@ -93,11 +111,7 @@ class _DiagnosticWidgetState extends ConsumerState<DiagnosticWidget> {
   }
 
   Widget _buildDTCList() {
-    // Placeholder DTC data
-    final dtcs = [
-      {'code': 'P0171', 'description': 'System Too Lean (Bank 1)'},
-      {'code': 'P0300', 'description': 'Random/Multiple Cylinder Misfire'},
-    ];
+    const dtcs = _placeholderDtcs;
 
     if (dtcs.isEmpty) {
       return Container(
@@ -153,12 +167,11 @@ class _DiagnosticWidgetState extends ConsumerState<DiagnosticWidget> {
             Wrap(
               spacing: 8,
               runSpacing: 8,
-              children: _quickCommands.map((command) {
-                final description = AppConstants.pidNames[command] ?? 'Unknown';
+              children: _quickCommandChips.map((chip) {
                 return ActionChip(
-                  label: Text('$command\n${description.split(' ').take(3).join(' ')}'),
-                  onPressed: () => _sendCommand(command),
-                  tooltip: description,
+                  label: Text(chip.label),
+                  onPressed: () => _sendCommand(chip.command),
+                  tooltip: chip.tooltip,
                 );
               }).toList(),
             ),
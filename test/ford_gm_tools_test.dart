@@ -11,8 +11,11 @@ void main() {
     late FordService fordService;
     late OBDService mockOBDService;
 
-    setUp(() {
+    setUpAll(() {
       mockOBDService = OBDService();
+    });
+
+    setUp(() {
       fordService = FordService(mockOBDService);
     });
 
@@ -69,8 +72,11 @@ void main() {
     late GMService gmService;
     late OBDService mockOBDService;
 
-    setUp(() {
+    setUpAll(() {
       mockOBDService = OBDService();
+    });
+
+    setUp(() {
       gmService = GMService(mockOBDService);
     });
 
@@ -26,82 +26,46 @@ void main() {
     });
 
     test('should validate Bluetooth address format', () {
-      // Valid Bluetooth addresses
-      final validProfile1 = ConnectionProfile.create(
-        name: 'BT Device 1',
-        type: ConnectionType.bluetooth,
-        address: '00:1D:A5:68:98:8B',
-      );
-      expect(validProfile1.validate(), isEmpty);
-
-      final validProfile2 = ConnectionProfile.create(
-        name: 'BT Device 2',
-        type: ConnectionType.bluetooth,
-        address: 'aa:bb:cc:dd:ee:ff',
-      );
-      expect(validProfile2.validate(), isEmpty);
-
-      // Invalid Bluetooth addresses
-      final invalidProfile1 = ConnectionProfile.create(
-        name: 'Invalid BT 1',
-        type: ConnectionType.bluetooth,
-        address: '00:1D:A5:68:98',  // Too short
-      );
-      expect(invalidProfile1.validate(), isNotEmpty);
-
-      final invalidProfile2 = ConnectionProfile.create(
-        name: 'Invalid BT 2',
-        type: ConnectionType.bluetooth,
-        address: '00-1D-A5-68-98-8B-XX',  // Too long
-      );
-      expect(invalidProfile2.validate(), isNotEmpty);
-
-      final invalidProfile3 = ConnectionProfile.create(
-        name: 'Invalid BT 3',
-        type: ConnectionType.bluetooth,
-        address: 'invalid-address',
-      );
-      expect(invalidProfile3.validate(), isNotEmpty);
+      const cases = [
+        // Valid Bluetooth addresses
+        ('00:1D:A5:68:98:8B', true),
+        ('aa:bb:cc:dd:ee:ff', true),
+        // Invalid Bluetooth addresses
+        ('00:1D:A5:68:98', false),  // Too short
+        ('00-1D-A5-68-98-8B-XX', false),  // Too long
+        ('invalid-address', false),
+      ];
+
+      for (final (address, isValid) in cases) {
+        final profile = ConnectionProfile.create(
+          name: 'BT Device',
+          type: ConnectionType.bluetooth,
+          address: address,
+        );
+        expect(profile.validate(), isValid ? isEmpty : isNotEmpty, reason: address);
+      }
     });
 
     test('should validate WiFi IP addresses', () {
-      // Valid IP addresses
-      final validProfile1 = ConnectionProfile.create(
-        name: 'WiFi Device 1',
-        type: ConnectionType.wifi,
-        address: '192.168.1.100',
-      );
-      expect(validProfile1.validate(), isEmpty);
-
-      final validProfile2 = ConnectionProfile.create(
-        name: 'WiFi Device 2',
-        type: ConnectionType.wifi,
-        address: '10.0.0.1',
-      );
-      expect(validProfile2.validate(), isEmpty);
-
-      // Valid hostnames
-      final validProfile3 = ConnectionProfile.create(
-        name: 'WiFi Device 3',
-        type: ConnectionType.wifi,
-        address: 'obd.local',
-      );
-      expect(validProfile3.validate(), isEmpty);
-
-      // Invalid IP addresses
-      final invalidProfile1 = ConnectionProfile.create(
-        name: 'Invalid WiFi 1',
-        type: ConnectionType.wifi,
-        address: '999.999.999.999',  // Out of range
-      );
-      expect(invalidProfile1.validate(), isNotEmpty);
-
-      final invalidProfile2 = ConnectionProfile.create(
-        name: 'Invalid WiFi 2',
-        type: ConnectionType.wifi,
-        address: '192.168.1',  // Incomplete
-      );
-      expect(invalidProfile2.validate(), isNotEmpty);
+      const cases = [
+        // Valid IP addresses
+        ('192.168.1.100', true),
+        ('10.0.0.1', true),
+        // Valid hostnames
+        ('obd.local', true),
+        // Invalid IP addresses
+        ('999.999.999.999', false),  // Out of range
+        ('192.168.1', false),  // Incomplete
+      ];
+
+      for (final (address, isValid) in cases) {
+        final profile = ConnectionProfile.create(
+          name: 'WiFi Device',
+          type: ConnectionType.wifi,
+          address: address,
+        );
+        expect(profile.validate(), isValid ? isEmpty : isNotEmpty, reason: address);
+      }
     });
 
     test('should validate serial/USB connections', () {
@@ -160,6 +160,21 @@ void main() {
       expect(pidStats['average'], 1700.0);
     });
 
+    test('should reuse statistics for an unchanged session', () async {
+      await service.initialize();
+      await service.startLogging(sessionName: 'Test Session');
+      final session = await service.stopLogging();
+
+      final stats = service.getSessionStatistics(session!);
+
+      expect(service.getSessionStatistics(session), same(stats));
+      expect(() => stats['errorCount'] = 1, throwsUnsupportedError);
+      expect(
+        service.getSessionStatistics(session.copyWith(name: 'Renamed')),
+        isNot(same(stats)),
+      );
+    });
+
     test('should handle error responses in logging', () async {
       await service.initialize();
       await service.configureLogging(enabledPids: {'010C'});
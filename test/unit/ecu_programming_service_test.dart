@@ -0,0 +1,85 @@
+import 'dart:async';
+import 'dart:io';
+
+import 'package:fake_async/fake_async.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:new_obd2_tool/core/services/ecu_programming_service.dart';
+import 'package:new_obd2_tool/core/services/vehicle_service.dart';
+import 'package:new_obd2_tool/shared/models/ecu_programming.dart';
+import 'package:new_obd2_tool/shared/models/vehicle_info.dart';
+
+/// Completes [future], started in [clock]'s zone, when it also waits on real
+/// I/O: that I/O finishes on the real event loop, but the code after it is
+/// queued on the fake clock's microtasks.
+Future<T> _settle<T>(FakeAsync clock, Future<T> future) async {
+  var done = false;
+  future.then((_) => done = true, onError: (_) => done = true);
+  while (!done) {
+    clock.flushMicrotasks();
+    await Future<void>.delayed(Duration.zero);
+  }
+  return future;
+}
+
+void main() {
+  group('EcuProgrammingService', () {
+    late Directory tempDir;
+    late File programmingFile;
+
+    setUpAll(() async {
+      tempDir = await Directory.systemTemp.createTemp('ecu_programming_test');
+      programmingFile = File('${tempDir.path}/calibration.bin');
+      await programmingFile.writeAsBytes([0x01, 0x02, 0x03, 0x04]);
+
+      VehicleService.setSelectedVehicle(const VehicleInfo(
+        make: 'Ford',
+        model: 'F-150',
+        year: 2023,
+      ));
+      fakeAsync((clock) {
+        EcuProgrammingService.discoverEcus();
+        clock.elapse(const Duration(seconds: 2));
+      });
+    });
+
+    tearDownAll(() async {
+      VehicleService.setSelectedVehicle(null);
+      await tempDir.delete(recursive: true);
+    });
+
+    test('should stop emitting progress once a session is cancelled', () async {
+      final clock = FakeAsync();
+      final statuses = <ProgrammingStatus>[];
+      final subscription = EcuProgrammingService.sessionStream
+          .listen((session) => statuses.add(session.status));
+
+      // The session's stage waits run on the fake clock
+      final session = await _settle(
+        clock,
+        clock.run((_) => EcuProgrammingService.startProgrammingSession(
+              ecuId: 'engine_ecu',
+              mode: ProgrammingMode.flash,
+              filePath: programmingFile.path,
+            )),
+      );
+
+      // The session is now in its 2 s authentication wait
+      await EcuProgrammingService.cancelSession(session.id);
+
+      // Uncancelled, the backup would finish and publish the reading stage
+      // 5 s after the start
+      clock.elapse(const Duration(seconds: 6));
+      await Future<void>.delayed(Duration.zero);
+      await subscription.cancel();
+
+      expect(statuses, equals([
+        ProgrammingStatus.connecting,
+        ProgrammingStatus.authenticating,
+        ProgrammingStatus.cancelled,
+      ]));
+      expect(EcuProgrammingService.getSession(session.id)!.status,
+          equals(ProgrammingStatus.cancelled));
+      expect(EcuProgrammingService.getActiveSessions(), isEmpty);
+    });
+  });
+}
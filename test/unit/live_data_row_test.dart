@@ -0,0 +1,26 @@
+import 'package:flutter_test/flutter_test.dart';
+import 'package:new_obd2_tool/shared/models/live_data_row.dart';
+
+void main() {
+  group('buildLiveDataRows', () {
+    test('should format values and resolve units per entry', () {
+      final rows = buildLiveDataRows(
+        {'Engine RPM': 2000, 'Fuel Level': 75.5},
+        (dataType) => dataType == 'Engine RPM' ? 'RPM' : '%',
+      );
+
+      expect(rows, equals([
+        (title: 'Engine RPM', value: '2000', unit: 'RPM'),
+        (title: 'Fuel Level', value: '75.5', unit: '%'),
+      ]));
+    });
+
+    test('should keep at most eight rows', () {
+      final liveData = {for (var i = 0; i < 12; i++) 'PID $i': i};
+      final rows = buildLiveDataRows(liveData, (_) => '');
+
+      expect(rows.length, equals(8));
+      expect(rows.last.title, equals('PID 7'));
+    });
+  });
+}
@@ -67,6 +67,48 @@ void main() {
       expect(response.parsedData, isNull);
     });
 
+    test('should treat every ELM327 error reply as an error', () {
+      const errorReplies = ['ERROR', 'STOPPED', 'UNABLE TO CONNECT', '?'];
+
+      for (final rawResponse in errorReplies) {
+        final response = OBDResponse.fromRaw(rawResponse, '010C');
+
+        expect(response.isError, true);
+        expect(response.errorMessage, equals(rawResponse));
+      }
+    });
+
+    test('should clean line breaks, prompt and case from raw adapter output', () {
+      const rawResponse = ' 41 0c 1a f8 \r\r>';
+      final response = OBDResponse.fromRaw(rawResponse, '010C');
+
+      expect(response.isError, false);
+      expect(response.rawData, equals('41 0C 1A F8'));
+      expect(response.parsedData['value'], equals(1726.0));
+    });
+
+    test('should skip the SEARCHING... line ahead of the first reply', () {
+      final response = OBDResponse.fromRaw('SEARCHING...\r41 0C 1A F8\r\r>', '010C');
+
+      expect(response.isError, false);
+      expect(response.rawData, equals('41 0C 1A F8'));
+      expect(response.parsedData['value'], equals(1726.0));
+    });
+
+    test('should report a failed protocol search as an error', () {
+      final response = OBDResponse.fromRaw('SEARCHING...\rUNABLE TO CONNECT\r\r>', '010C');
+
+      expect(response.isError, true);
+      expect(response.errorMessage, equals('UNABLE TO CONNECT'));
+    });
+
+    test('should keep non-hex adapter replies as raw data', () {
+      final response = OBDResponse.fromRaw('OK\r\r>', 'ATE0');
+
+      expect(response.isError, false);
+      expect(response.parsedData['raw_hex'], equals('OK'));
+    });
+
     test('should handle unknown command responses', () {
       const rawResponse = '41 FF 12 34';
       final response = OBDResponse.fromRaw(rawResponse, '01FF');
@@ -122,4 +164,21 @@ void main() {
       expect(response.parsedData!['description'], equals('MAF Air Flow Rate'));
     });
   });
+
+  group('OBDHexPayload', () {
+    test('should read the whole payload ignoring spaces', () {
+      expect('01'.hexValue, equals(1));
+      expect('1A F8'.hexValue, equals(0x1AF8));
+      expect(() => 'NO DATA'.hexValue, throwsFormatException);
+    });
+
+    test('should read single bytes by position ignoring spaces', () {
+      const payload = '01 7F C8';
+
+      expect(payload.hexByteAt(0), equals(0x01));
+      expect(payload.hexByteAt(1), equals(0x7F));
+      expect(payload.hexByteAt(2), equals(0xC8));
+      expect(() => payload.hexByteAt(3), throwsRangeError);
+    });
+  });
 }
\ No newline at end of file
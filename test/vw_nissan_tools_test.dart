@@ -10,7 +10,7 @@ import 'package:new_obd2_tool/features/nissan_tools/models/nissan_data_models.da
 class MockOBDService extends OBDService {
   @override
   Future<Map<String, dynamic>> getLiveData() async {
-    return {
+    return const {
       'Engine RPM': 2000,
       'Vehicle Speed': 45,
       'Coolant Temperature': 85,
@@ -52,8 +52,11 @@ void main() {
     late VWService vwService;
     late MockOBDService mockOBDService;
 
-    setUp(() {
+    setUpAll(() {
       mockOBDService = MockOBDService();
+    });
+
+    setUp(() {
       vwService = VWService(mockOBDService);
     });
 
@@ -144,8 +147,11 @@ void main() {
     late NissanService nissanService;
     late MockOBDService mockOBDService;
 
-    setUp(() {
+    setUpAll(() {
       mockOBDService = MockOBDService();
+    });
+
+    setUp(() {
       nissanService = NissanService(mockOBDService);
     });
 